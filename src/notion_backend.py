@@ -7,13 +7,50 @@ Provides basic database operations for storing startup data.
 
 import os
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-
-from tools.notion import NotionAPI
+from typing import Dict, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+def _page_type(page: Dict[str, Any]) -> str:
+    """Extract the Type select value from a database page"""
+    return page.get("properties", {}).get("Type", {}).get("select", {}).get("name", "")
+
+# Main database name and schema (simple database with basic properties)
+_MAIN_DB_NAME = "LazyPreneur Data"
+_MAIN_DB_PROPERTIES = {
+    "Title": {"title": {}},
+    "Type": {"select": {
+        "options": [
+            {"name": "Startup Config", "color": "blue"},
+            {"name": "Working Session", "color": "green"},
+            {"name": "Agent Interaction", "color": "yellow"},
+            {"name": "System Update", "color": "red"}
+        ]
+    }},
+    "Content": {"rich_text": {}},
+    "Created At": {"date": {}},
+    "Status": {"select": {
+        "options": [
+            {"name": "Active", "color": "green"},
+            {"name": "Completed", "color": "blue"},
+            {"name": "Archived", "color": "gray"}
+        ]
+    }}
+}
+
+# get_data listings are reused this long; pages written by other clients or processes show up after it
+DATA_CACHE_TTL_SECS = 10
+
+# Notion's maximum length for a single rich_text content string
+_CONTENT_LIMIT = 2000
+
+def _title_eq(db: Dict[str, Any], name: str) -> bool:
+    """Check whether any title fragment of a Notion database equals name"""
+    return any(title.get("text", {}).get("content", "") == name for title in db.get("title") or ())
+
 class NotionBackend:
     """Simple Notion backend for LazyPreneur data storage"""
     
@@ -27,9 +64,21 @@ class NotionBackend:
         if not self.parent_page_id:
             raise ValueError("Notion parent page ID is required")
         
+        # Imported lazily so the Notion client is only loaded when Notion is actually used
+        from tools.notion import NotionAPI
         self.notion = NotionAPI(self.notion_token)
         self.databases = {}
         
+        # get_data results keyed by data_type as (monotonic time fetched, pages),
+        # invalidated on every write through this backend and expired after DATA_CACHE_TTL_SECS
+        self._data_cache: Dict[Optional[str], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._data_version = 0
+        
+        # Background writers for fire-and-forget saves (Notion has no batch create endpoint).
+        # Created here rather than on first use, since the backend is shared across threads;
+        # worker threads still only start when the first save is queued
+        self._writer = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notion-writer")
+        
         # Create main database if it doesn't exist
         self._setup_main_database()
     
@@ -37,16 +86,16 @@ class NotionBackend:
         """Find an existing database by name"""
         try:
             # Search for databases by name
-            search_result = self.notion.search_databases(database_name)
+            search_result = self.notion.search_databases(database_name, page_size=10)
             if search_result["success"]:
-                databases = search_result.get("databases", [])
-                for db in databases:
-                    # Check if the database title matches (name is the same)
-                    db_title = db.get("title", [])
-                    if db_title and any(title.get("text", {}).get("content", "") == database_name for title in db_title):
-                        # If name matches, return the database ID (regardless of parent page)
-                        logger.info(f"Found existing database '{database_name}' with ID: {db.get('id')}")
-                        return db.get("id")
+                # First database whose title matches exactly (regardless of parent page)
+                db_id = next(
+                    (db.get("id") for db in search_result.get("databases", []) if _title_eq(db, database_name)),
+                    None
+                )
+                if db_id:
+                    logger.info(f"Found existing database '{database_name}' with ID: {db_id}")
+                    return db_id
             
             logger.info(f"No existing database found with name '{database_name}'")
             return None
@@ -57,32 +106,10 @@ class NotionBackend:
     def _create_main_database(self):
         """Create the main LazyPreneur database"""
         try:
-            # Simple database with basic properties
-            properties = {
-                "Title": {"title": {}},
-                "Type": {"select": {
-                    "options": [
-                        {"name": "Startup Config", "color": "blue"},
-                        {"name": "Working Session", "color": "green"},
-                        {"name": "Agent Interaction", "color": "yellow"},
-                        {"name": "System Update", "color": "red"}
-                    ]
-                }},
-                "Content": {"rich_text": {}},
-                "Created At": {"date": {}},
-                "Status": {"select": {
-                    "options": [
-                        {"name": "Active", "color": "green"},
-                        {"name": "Completed", "color": "blue"},
-                        {"name": "Archived", "color": "gray"}
-                    ]
-                }}
-            }
-            
             result = self.notion.create_database(
                 self.parent_page_id,
-                "LazyPreneur Data",
-                properties
+                _MAIN_DB_NAME,
+                _MAIN_DB_PROPERTIES
             )
             
             if result["success"]:
@@ -96,7 +123,7 @@ class NotionBackend:
     
     def _setup_main_database(self):
         """Setup the main database - find existing or create new"""
-        database_name = "LazyPreneur Data"
+        database_name = _MAIN_DB_NAME
         
         # First, try to find an existing database
         existing_db_id = self._find_existing_database(database_name)
@@ -118,8 +145,14 @@ class NotionBackend:
     def set_database_id(self, database_id: str):
         """Manually set the database ID if you know it exists"""
         self.databases["main"] = database_id
+        self._invalidate_data_cache()
         logger.info(f"Manually set database ID: {database_id}")
     
+    def _invalidate_data_cache(self):
+        """Drop cached get_data results after a write"""
+        self._data_version += 1
+        self._data_cache.clear()
+    
     def save_data(self, title: str, content: str, data_type: str = "System Update") -> Dict[str, Any]:
         """Save any data to Notion"""
         try:
@@ -129,7 +162,7 @@ class NotionBackend:
             properties = {
                 "Title": {"title": [{"text": {"content": title}}]},
                 "Type": {"select": {"name": data_type}},
-                "Content": {"rich_text": [{"text": {"content": content[:2000]}}]},  # Notion limit
+                "Content": {"rich_text": [{"text": {"content": content[:_CONTENT_LIMIT]}}]},
                 "Created At": {"date": {"start": datetime.now().isoformat()}},
                 "Status": {"select": {"name": "Active"}}
             }
@@ -141,6 +174,7 @@ class NotionBackend:
             )
             
             if result["success"]:
+                self._invalidate_data_cache()
                 logger.info(f"Saved data: {title}")
                 return {"success": True, "page_id": result["page_id"]}
             else:
@@ -151,48 +185,66 @@ class NotionBackend:
             logger.error(f"Error saving data: {e}")
             return {"success": False, "error": str(e)}
     
+    def _queue(self, save, *args) -> Future:
+        return self._writer.submit(save, *args)
+    
+    def queue_data(self, title: str, content: str, data_type: str = "System Update") -> Future:
+        """Save data to Notion in the background; returns a Future resolving to the save_data result"""
+        return self._queue(self.save_data, title, content, data_type)
+    
+    def queue_startup_config(self, startup_data: Dict) -> Future:
+        """Save the startup configuration in the background; returns a Future resolving to the save result"""
+        return self._queue(self.save_startup_config, startup_data)
+    
+    def queue_working_session(self, session_data: Dict) -> Future:
+        """Save working session data in the background; returns a Future resolving to the save result"""
+        return self._queue(self.save_working_session, session_data)
+    
     def save_startup_config(self, startup_data: Dict) -> Dict[str, Any]:
         """Save startup configuration"""
-        business_info = startup_data.get('business_info', {})
-        content = f"""
-Startup: {business_info.get('name', 'Unnamed')}
-Industry: {business_info.get('industry', 'Unknown')}
-Business Model: {business_info.get('business_model', 'Unknown')}
-Funding Stage: {business_info.get('funding_stage', 'Unknown')}
-Agents: {', '.join(startup_data.get('selected_agents', []))}
-Tools: {', '.join(startup_data.get('selected_tools', []))}
-AI Provider: {startup_data.get('api_keys', {}).get('ai_provider', 'Unknown')}
-        """.strip()
+        business_info = startup_data.get('business_info') or {}
+        api_keys = startup_data.get('api_keys') or {}
+        name = business_info.get('name', 'Unnamed')
+        content = "\n".join((
+            f"Startup: {name}",
+            f"Industry: {business_info.get('industry', 'Unknown')}",
+            f"Business Model: {business_info.get('business_model', 'Unknown')}",
+            f"Funding Stage: {business_info.get('funding_stage', 'Unknown')}",
+            f"Agents: {', '.join(startup_data.get('selected_agents', []))}",
+            f"Tools: {', '.join(startup_data.get('selected_tools', []))}",
+            f"AI Provider: {api_keys.get('ai_provider', 'Unknown')}",
+        ))
         
         return self.save_data(
-            f"Startup Config - {business_info.get('name', 'Unnamed')}",
+            f"Startup Config - {name}",
             content,
             "Startup Config"
         )
     
     def save_working_session(self, session_data: Dict) -> Dict[str, Any]:
         """Save working session data"""
-        content = f"""
-Session ID: {session_data.get('session_id', 'Unknown')}
-Duration: {session_data.get('duration', 0)} minutes
-Activities: {len(session_data.get('activities', []))}
-Summary: {session_data.get('final_summary', 'No summary')}
-        """.strip()
+        session_id = session_data.get('session_id', 'Unknown')
+        content = "\n".join((
+            f"Session ID: {session_id}",
+            f"Duration: {session_data.get('duration', 0)} minutes",
+            f"Activities: {len(session_data.get('activities', []))}",
+            f"Summary: {session_data.get('final_summary', 'No summary')}",
+        ))
         
         return self.save_data(
-            f"Working Session - {session_data.get('session_id', 'Unknown')}",
+            f"Working Session - {session_id}",
             content,
             "Working Session"
         )
     
     def save_agent_interaction(self, agent_name: str, topic: str, response: str, session_id: str = "") -> Dict[str, Any]:
         """Save agent interaction"""
-        content = f"""
-Agent: {agent_name}
-Topic: {topic}
-Session: {session_id}
-Response: {response}
-        """.strip()
+        content = "\n".join((
+            f"Agent: {agent_name}",
+            f"Topic: {topic}",
+            f"Session: {session_id}",
+            f"Response: {response}",
+        ))
         
         return self.save_data(
             f"Agent Interaction - {agent_name}",
@@ -206,19 +258,27 @@ Response: {response}
             if "main" not in self.databases:
                 return []
             
-            # Simple query - get all pages
-            result = self.notion.query_database(self.databases["main"])
+            # Serve from cache unless a write happened since the last query or it has expired
+            now = time.monotonic()
+            cached = self._data_cache.get(data_type)
+            if cached and now - cached[0] < DATA_CACHE_TTL_SECS:
+                return cached[1]
+            full = self._data_cache.get(None)
+            if data_type and full and now - full[0] < DATA_CACHE_TTL_SECS:
+                # Derive the typed view from the cached full listing in one pass
+                pages = [page for page in full[1] if _page_type(page) == data_type]
+                self._data_cache[data_type] = (full[0], pages)
+                return pages
+            version = self._data_version
+            
+            # Let Notion filter by type if specified
+            filter_params = {"property": "Type", "select": {"equals": data_type}} if data_type else None
+            result = self.notion.query_database(self.databases["main"], filter_params=filter_params)
             
             if result["success"]:
                 pages = result.get("pages", [])
-                if data_type:
-                    # Filter by type if specified
-                    filtered_pages = []
-                    for page in pages:
-                        page_type = page.get("properties", {}).get("Type", {}).get("select", {}).get("name", "")
-                        if page_type == data_type:
-                            filtered_pages.append(page)
-                    return filtered_pages
+                if version == self._data_version:
+                    self._data_cache[data_type] = (now, pages)
                 return pages
             else:
                 logger.error(f"Failed to query database: {result['error']}")
@@ -236,4 +296,16 @@ Response: {response}
             "data_count": len(self.get_data())
         }
 
- 
\ No newline at end of file
+ 
+
+# Backends shared per (token, parent page) so the database lookup runs once per process
+_backends: Dict[tuple, NotionBackend] = {}
+
+def get_notion_backend(notion_token: Optional[str] = None, parent_page_id: Optional[str] = None) -> NotionBackend:
+    """Get a shared NotionBackend, constructing it only on first use or if its database is missing"""
+    key = (notion_token or os.getenv('NOTION_API_TOKEN'), parent_page_id or os.getenv('NOTION_PARENT_PAGE_ID'))
+    backend = _backends.get(key)
+    if backend is None or "main" not in backend.databases:
+        backend = NotionBackend(*key)
+        _backends[key] = backend
+    return backend
@@ -6,67 +6,457 @@ Manages AI agent interactions and tool integrations for autonomous startup manag
 """
 
 import logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 import os
 import json
 import asyncio
+import hashlib
+import importlib
+import random
+import re
+import sys
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncIterator, Optional
 from dataclasses import dataclass
 import openai
 import time
-import requests
+import aiohttp
 
-# Import our tool integrations
+# Optional faster JSON encoder
 try:
-    from tools.notion import NotionAPI
-    NOTION_AVAILABLE = True
+    import orjson
 except ImportError:
-    NOTION_AVAILABLE = False
-    logger.warning("Notion API not available - tools/notion.py not found")
+    orjson = None
 
-try:
-    from tools.slack import Slack, SlackBotManager
-    SLACK_AVAILABLE = True
-except ImportError:
-    SLACK_AVAILABLE = False
-    logger.warning("Slack API not available - tools/slack.py not found")
+# Tool integrations are imported on first use so unselected tools cost nothing
+def _load_tool(module_name: str, attr: str, label: str):
+    """Import a tool class lazily; returns None when the integration is unavailable"""
+    try:
+        return getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError):
+        logger.warning(f"{label} not available - {module_name.replace('.', '/')}.py not found")
+        return None
 
-try:
-    from tools.x import XPlatform
-    X_PLATFORM_AVAILABLE = True
-except ImportError:
-    X_PLATFORM_AVAILABLE = False
-    logger.warning("X Platform API not available - tools/x.py not found")
+def _format_contributions(contributions: Dict[str, str]) -> str:
+    """Render agent contributions for a summary prompt as plain sections, without JSON quoting"""
+    return "\n\n".join(f"### {name}\n{response}" for name, response in contributions.items())
+
+def _json_bytes(obj) -> bytes:
+    """Serialize a request payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _now_iso() -> str:
+    """Current local time as an ISO string; second precision is all the records need"""
+    return datetime.now().isoformat(timespec='seconds')
+
+SLACK_BOT_NAMES = ("CEO", "CFO", "CTO", "CMO")
+
+@dataclass(frozen=True)
+class EnvConfig:
+    """Integration credentials, read from the environment once at import"""
+    slack_tokens: Dict[str, str]
+    notion_token: str = None
+    x_credentials: Dict[str, str] = None
+
+    @classmethod
+    def from_env(cls) -> "EnvConfig":
+        x_credentials = {
+            "api_key": os.getenv('X_API_KEY'),
+            "api_secret": os.getenv('X_API_SECRET'),
+            "access_token": os.getenv('X_ACCESS_TOKEN'),
+            "access_token_secret": os.getenv('X_ACCESS_TOKEN_SECRET')
+        }
+        return cls(
+            slack_tokens={name: os.getenv(f"SLACK_API_TOKEN_{name}") for name in SLACK_BOT_NAMES},
+            notion_token=os.getenv('NOTION_API_TOKEN'),
+            x_credentials=x_credentials if all(x_credentials.values()) else None
+        )
+
+ENV_CONFIG = EnvConfig.from_env()
+
+# Outbound post rates: Slack allows about one message per second per channel
+SLACK_POSTS_PER_SEC = 1.0
+X_POSTS_PER_SEC = 0.5
+
+# Longest a working-session agent turn may take before it is reported as an error
+AGENT_TURN_TIMEOUT_SECS = 30
+
+# How long a get_system_status snapshot is served to UI polls before rebuilding
+STATUS_CACHE_TTL_SECS = 1.0
+
+# Keep-alive pool for Gemini requests, shared by every agent on a loop
+GEMINI_POOL_SIZE = 16
+GEMINI_KEEPALIVE_SECS = 90
+GEMINI_TIMEOUT_SECS = 60
+
+# Retry transient Gemini failures with exponential backoff and full jitter
+GEMINI_MAX_ATTEMPTS = 4
+GEMINI_BACKOFF_BASE_SECS = 0.5
+GEMINI_BACKOFF_MAX_SECS = 10
+GEMINI_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class TransientLLMError(Exception):
+    """A provider error worth retrying, optionally carrying the server's Retry-After"""
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker that stops calling a failing provider for a cool-down"""
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        # When the single half-open trial call was admitted, or None if none is in flight
+        self.probe_started = None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return False
+        # Half-open: admit one trial call; a trial that never reported back (e.g. a
+        # cancelled stream) is replaced after another cool-down
+        if self.probe_started is not None and now - self.probe_started < self.reset_timeout:
+            return False
+        self.probe_started = now
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        # A failed trial reopens the breaker for a full cool-down
+        if self.probe_started is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.probe_started = None
+
+# Gemini reports non-retryable HTTP errors in-band with this prefix instead of raising
+_GEMINI_ERROR_PREFIX = "[Gemini API error"
+
+# Provider responses that mean "slow down" rather than "this request is broken"
+_OVERLOAD_ERRORS = (TransientLLMError, openai.RateLimitError, openai.InternalServerError)
+
+# Opt-in deterministic mode: temperature 0 and identical prompts served from cache
+LLM_RESPONSE_CACHE = os.getenv('LLM_RESPONSE_CACHE', '').lower() in ('1', 'true', 'yes')
+
+class ResponseCache:
+    """In-memory LRU cache of LLM responses with a per-entry TTL"""
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, context: str) -> str:
+        payload = json.dumps({"model": model, "sys": system_prompt, "ctx": context}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def set(self, key: str, value: str, ttl: float = None):
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_response_cache = ResponseCache()
+
+# Upper bound on LLM requests in flight per event loop, across all agents
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', '8'))
+_llm_semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+def _llm_slots() -> asyncio.Semaphore:
+    """Semaphore bounding LLM fan-out on the running loop (semaphores cannot cross loops)"""
+    loop = asyncio.get_running_loop()
+    slots = _llm_semaphores.get(loop)
+    if slots is None:
+        for stale in [l for l in _llm_semaphores if l.is_closed()]:
+            del _llm_semaphores[stale]
+        slots = _llm_semaphores[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return slots
+
+# Calls finishing within this many seconds let a provider's concurrency limit grow
+LLM_TARGET_LATENCY_SECS = float(os.getenv('LLM_TARGET_LATENCY_SECS', '8'))
+
+class AIMDLimiter:
+    """Adaptive per-provider concurrency limit: additive increase while calls finish within
+    the latency target, multiplicative decrease when the provider reports overload"""
+    def __init__(self, initial: float = 2.0, minimum: float = 1.0, maximum: float = LLM_CONCURRENCY,
+                 target_latency: float = LLM_TARGET_LATENCY_SECS):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        # Conditions cannot cross loops, so each loop gets its own gate: [condition, in-flight count]
+        self._gates: Dict[asyncio.AbstractEventLoop, list] = {}
+
+    def on_success(self, latency: float):
+        if latency <= self.target_latency:
+            self.limit = min(self.maximum, self.limit + 0.5)
+
+    def on_overload(self):
+        self.limit = max(self.minimum, self.limit * 0.5)
+
+    @asynccontextmanager
+    async def slot(self):
+        loop = asyncio.get_running_loop()
+        gate = self._gates.get(loop)
+        if gate is None:
+            for stale in [l for l in self._gates if l.is_closed()]:
+                del self._gates[stale]
+            gate = self._gates[loop] = [asyncio.Condition(), 0]
+        condition = gate[0]
+        async with condition:
+            await condition.wait_for(lambda: gate[1] < int(self.limit))
+            gate[1] += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                gate[1] -= 1
+                condition.notify_all()
+
+# Provider calls currently running, keyed like the response cache
+_inflight_thinks: Dict[str, asyncio.Task] = {}
+
+# Matches the first 100 words only when a 101st follows
+_OVER_100_WORDS = re.compile(r'\s*(?:\S+\s+){99}\S+(?=\s+\S)')
+
+def _limit_words(response: str) -> str:
+    """Trim a response to its first 100 words in a single regex pass"""
+    # 101 words need at least 101 characters plus 100 separators
+    if len(response) <= 200:
+        return response
+    match = _OVER_100_WORDS.match(response)
+    return response[:match.end()] + "..." if match else response
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter for coroutines.
+
+    Tokens may go negative: each caller reserves its slot and sleeps until it
+    is due, so no lock is needed and the bucket works on any event loop.
+    """
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+# Slack limits are per channel and shared by every agent bot posting there
+_slack_limiters: Dict[str, AsyncTokenBucket] = {}
+
+def _slack_limiter(channel: str) -> AsyncTokenBucket:
+    limiter = _slack_limiters.get(channel)
+    if limiter is None:
+        limiter = _slack_limiters[channel] = AsyncTokenBucket(SLACK_POSTS_PER_SEC)
+    return limiter
+
+def _slack_timestamp(communicated: Dict):
+    """Message timestamp of a successful Agent.communicate result, else None"""
+    result = communicated.get("result") or {}
+    return result.get("timestamp") if result.get("success") else None
 
 class GeminiClient:
-    """Direct Gemini 2.0 API client using HTTP requests"""
+    """Direct Gemini 2.0 API client using async HTTP requests"""
+    model = "gemini-2.0-flash"
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+        self.breaker = CircuitBreaker()
+        self.concurrency = AIMDLimiter()
+        self.url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:streamGenerateContent"
         self.headers = {
             "Content-Type": "application/json",
             "X-goog-api-key": self.api_key
         }
-    def generate_content(self, prompt: str) -> str:
+        self._session = None
+        self._loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions are bound to the loop they were created on, and the
+        # orchestrator may be driven from more than one loop (e.g. asyncio.run callers)
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=GEMINI_POOL_SIZE, keepalive_timeout=GEMINI_KEEPALIVE_SECS),
+                timeout=aiohttp.ClientTimeout(total=GEMINI_TIMEOUT_SECS),
+            )
+            self._loop = loop
+        return self._session
+
+    async def stream_content(self, prompt: str, system_instruction: str = None, temperature: float = None) -> AsyncIterator[str]:
+        """Yield response text chunks as Gemini streams them over SSE"""
         data = {
             "contents": [
                 {"parts": [{"text": prompt}]}
             ]
         }
-        resp = requests.post(self.url, headers=self.headers, json=data)
-        if resp.status_code == 200:
-            result = resp.json()
-            # Try to extract the text from the response
+        if temperature is not None:
+            data["generationConfig"] = {"temperature": temperature}
+        if system_instruction:
+            # Sent separately so the request prefix stays identical across calls
+            data["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+        async with self._get_session().post(self.url, params={"alt": "sse"}, data=_json_bytes(data)) as resp:
+            if resp.status in GEMINI_RETRY_STATUSES:
+                retry_after = resp.headers.get("Retry-After")
+                raise TransientLLMError(
+                    f"Gemini API error: {resp.status}",
+                    float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+            if resp.status != 200:
+                logger.error(f"Gemini API error: {resp.status} {await resp.text()}")
+                yield f"{_GEMINI_ERROR_PREFIX}: {resp.status}]"
+                return
+            async for line in resp.content:
+                if not line.startswith(b"data: "):
+                    continue
+                chunk = _json_loads(line[6:])
+                # Try to extract the text from the chunk
+                try:
+                    text = chunk["candidates"][0]["content"]["parts"][0]["text"]
+                except (KeyError, IndexError, TypeError):
+                    continue
+                yield text
+
+    async def generate_content(self, prompt: str, system_instruction: str = None, temperature: float = None) -> str:
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
             try:
-                return result["candidates"][0]["content"]["parts"][0]["text"]
-            except Exception:
-                return str(result)
-        else:
-            logger.error(f"Gemini API error: {resp.status_code} {resp.text}")
-            return f"[Gemini API error: {resp.status_code}]"
+                return "".join([
+                    text async for text in self.stream_content(prompt, system_instruction, temperature)
+                ])
+            except (TransientLLMError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                    raise
+                await self._backoff(e, attempt)
+
+    async def _backoff(self, error: Exception, attempt: int):
+        delay = getattr(error, "retry_after", None)
+        if delay is None:
+            delay = random.uniform(0, min(GEMINI_BACKOFF_MAX_SECS, GEMINI_BACKOFF_BASE_SECS * 2 ** attempt))
+        logger.warning(f"Gemini request failed ({error}); retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """Close this loop's HTTP session so its pooled connections are released"""
+        if self._session is not None and not self._session.closed and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+
+    async def complete(self, system_prompt: str, context: str, temperature: float = None) -> str:
+        return await self.generate_content(f"Context: {context}", system_instruction=system_prompt, temperature=temperature)
+
+    async def stream(self, system_prompt: str, context: str, temperature: float = None) -> AsyncIterator[str]:
+        """Stream a completion; failures are only retried before the first chunk is yielded"""
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            started = False
+            try:
+                async for text in self.stream_content(f"Context: {context}", system_prompt, temperature):
+                    started = True
+                    yield text
+                return
+            except (TransientLLMError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if started or attempt == GEMINI_MAX_ATTEMPTS - 1:
+                    raise
+                await self._backoff(e, attempt)
+
+class OpenAIClient:
+    """OpenAI client exposing an AsyncOpenAI `chat` bound to the running loop"""
+    model = "gpt-4"
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        # The OpenAI SDK already retries 429/5xx with jittered backoff
+        self.breaker = CircuitBreaker()
+        self.concurrency = AIMDLimiter()
+        self._client = None
+        self._loop = None
+
+    @property
+    def chat(self):
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = openai.AsyncOpenAI(api_key=self.api_key)
+            self._loop = loop
+        return self._client.chat
+
+    async def aclose(self):
+        """Close this loop's AsyncOpenAI client so its pooled connections are released"""
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.close()
+        self._client = None
+
+    async def complete(self, system_prompt: str, context: str, temperature: float = None) -> str:
+        extra = {"temperature": temperature} if temperature is not None else {}
+        response = await self.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": context}
+            ],
+            max_tokens=500,
+            **extra
+        )
+        return response.choices[0].message.content
+
+    async def stream(self, system_prompt: str, context: str, temperature: float = None) -> AsyncIterator[str]:
+        extra = {"temperature": temperature} if temperature is not None else {}
+        response = await self.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": context}
+            ],
+            max_tokens=500,
+            stream=True,
+            **extra
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
 @dataclass
 class AgentConfig:
@@ -85,21 +475,10 @@ class AgentConfig:
 
 
 
-class Agent:
-    """Base class for AI agents"""
-    
-    def __init__(self, config: AgentConfig, ai_client, tools: Dict[str, Any]):
-        self.config = config
-        self.ai_client = ai_client
-        self.tools = tools
-        self.conversation_history = []
-        self.task_queue = []
-        
-    def get_system_prompt(self) -> str:
-        """Get the system prompt for this agent"""
-        return f"""You are {self.config.name}, the {self.config.role} of a startup.
+# Shared by every agent; only the four %-fields differ between them
+_SYSTEM_PROMPT_TEMPLATE = """You are %(name)s, the %(role)s of a startup.
         
-Role: {self.config.description}
+Role: %(description)s
 
 Your responsibilities:
 - Make strategic decisions for your area of expertise
@@ -107,7 +486,7 @@ Your responsibilities:
 - Document important decisions and plans in Notion
 - Execute actions using available tools when needed
 
-Available tools: {', '.join(self.config.tools)}
+Available tools: %(tools)s
 
 Communication style:
 - Keep responses conversational and concise (under 100 words)
@@ -116,30 +495,134 @@ Communication style:
 - Use natural, engaging language
 - Focus on actionable insights and next steps
 """
+
+# Per-turn tails appended to a discussion's shared prefix
+_OPEN_TURN_TEMPLATE = """
+You are %(name)s (%(role)s). Start the discussion on this topic.
+Keep your response under 100 words and conversational in tone.
+"""
+
+_RESPOND_TURN_TEMPLATE = """
+%(previous_agent)s just said: "%(previous_response)s..."
+
+You are %(name)s (%(role)s). Respond to %(previous_agent)s's thoughts and add your perspective.
+Keep your response under 100 words and conversational in tone.
+"""
+
+class Agent:
+    """Base class for AI agents"""
+    
+    def __init__(self, config: AgentConfig, ai_client, tools: Dict[str, Any]):
+        self.config = config
+        self.ai_client = ai_client
+        self.tools = tools
+        self.conversation_history = []
+        self.task_queue = []
+        # The config does not change after construction, so build the prompt once
+        self._system_prompt = self._build_system_prompt()
+        # Provider is fixed for the agent's lifetime; resolve its call once
+        self._llm_call = ai_client.complete
+        
+    def get_system_prompt(self) -> str:
+        """Get the system prompt for this agent"""
+        return self._system_prompt
+
+    def _build_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT_TEMPLATE % {
+            "name": self.config.name,
+            "role": self.config.role,
+            "description": self.config.description,
+            "tools": ', '.join(self.config.tools)
+        }
     
     async def think(self, context: str) -> str:
         """Agent thinks about the given context and returns a response"""
+        cache_key = ResponseCache.make_key(self.ai_client.model, self._system_prompt, context)
+        if LLM_RESPONSE_CACHE:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Identical prompts already in flight on this loop share one provider call
+        loop = asyncio.get_running_loop()
+        call = _inflight_thinks.get(cache_key)
+        if call is None or call.done() or call.get_loop() is not loop:
+            call = loop.create_task(self._call_llm(context))
+            _inflight_thinks[cache_key] = call
+            
+            def forget(done):
+                if _inflight_thinks.get(cache_key) is done:
+                    del _inflight_thinks[cache_key]
+            call.add_done_callback(forget)
+        result, ok = await asyncio.shield(call)
+        
+        # Bracketed results are client error markers and must not be replayed
+        if LLM_RESPONSE_CACHE and ok and result and not result.startswith("["):
+            _response_cache.set(cache_key, result)
+        return result
+    
+    async def _call_llm(self, context: str):
+        """Call the provider behind the circuit breaker; returns (text, succeeded)"""
+        breaker = self.ai_client.breaker
+        if not breaker.allow():
+            return "I'm having trouble processing this right now. Error: AI provider is temporarily unavailable", False
+        temperature = 0 if LLM_RESPONSE_CACHE else None
+        limiter = self.ai_client.concurrency
         try:
-            if hasattr(self.ai_client, 'chat'):
-                # OpenAI client
-                response = self.ai_client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": self.get_system_prompt()},
-                        {"role": "user", "content": context}
-                    ],
-                    max_tokens=500
-                )
-                return response.choices[0].message.content
-            elif hasattr(self.ai_client, 'generate_content'):
-                # GeminiClient direct HTTP
-                return self.ai_client.generate_content(f"{self.get_system_prompt()}\n\nContext: {context}")
-            else:
-                # Fallback (should not happen)
-                return "[No valid AI client configured]"
+            async with _llm_slots(), limiter.slot():
+                started = time.monotonic()
+                result = await self._llm_call(self._system_prompt, context, temperature)
+                limiter.on_success(time.monotonic() - started)
+        except Exception as e:
+            if isinstance(e, _OVERLOAD_ERRORS):
+                limiter.on_overload()
+            breaker.record_failure()
+            logger.error(f"Error in agent thinking: {e}")
+            return f"I'm having trouble processing this right now. Error: {str(e)}", False
+        if result and result.startswith(_GEMINI_ERROR_PREFIX):
+            breaker.record_failure()
+            return result, False
+        breaker.record_success()
+        return result, True
+    
+    async def think_stream(self, context: str) -> AsyncIterator[str]:
+        """Agent thinks about the given context, yielding the response as it is generated"""
+        cache_key = ResponseCache.make_key(self.ai_client.model, self._system_prompt, context)
+        if LLM_RESPONSE_CACHE:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        breaker = self.ai_client.breaker
+        if not breaker.allow():
+            yield "I'm having trouble processing this right now. Error: AI provider is temporarily unavailable"
+            return
+        temperature = 0 if LLM_RESPONSE_CACHE else None
+        chunks = []
+        limiter = self.ai_client.concurrency
+        try:
+            async with _llm_slots(), limiter.slot():
+                started = time.monotonic()
+                async for delta in self.ai_client.stream(self._system_prompt, context, temperature):
+                    chunks.append(delta)
+                    yield delta
+                limiter.on_success(time.monotonic() - started)
         except Exception as e:
+            if isinstance(e, _OVERLOAD_ERRORS):
+                limiter.on_overload()
+            breaker.record_failure()
             logger.error(f"Error in agent thinking: {e}")
-            return f"I'm having trouble processing this right now. Error: {str(e)}"
+            yield f"I'm having trouble processing this right now. Error: {str(e)}"
+            return
+        
+        result = "".join(chunks)
+        if result.startswith(_GEMINI_ERROR_PREFIX):
+            breaker.record_failure()
+            return
+        breaker.record_success()
+        if LLM_RESPONSE_CACHE and result and not result.startswith("["):
+            _response_cache.set(cache_key, result)
     
     async def communicate(self, message: str, channel: str = "general") -> Dict:
         """Send a message to Slack channel"""
@@ -148,7 +631,8 @@ Communication style:
                 slack_manager = self.tools["slack"]
                 bot = slack_manager.get_bot(self.config.name)
                 if bot:
-                    result = bot.send_slack_message(channel, self.config.name, message)
+                    async with _slack_limiter(channel):
+                        result = await asyncio.to_thread(bot.send_slack_message, channel, self.config.name, message)
                     return {"success": True, "tool": "slack", "result": result}
                 else:
                     return {"success": False, "tool": "slack", "error": f"Bot {self.config.name} not found"}
@@ -157,6 +641,23 @@ Communication style:
                 return {"success": False, "tool": "slack", "error": str(e)}
         return {"success": False, "tool": "slack", "error": "Slack not available"}
     
+    async def communicate_update(self, message: str, timestamp: str, channel: str = "general") -> Dict:
+        """Replace the text of a Slack message this agent already sent"""
+        if "slack" in self.tools:
+            try:
+                slack_manager = self.tools["slack"]
+                bot = slack_manager.get_bot(self.config.name)
+                if bot:
+                    async with _slack_limiter(channel):
+                        result = await asyncio.to_thread(bot.update_slack_message, channel, timestamp, message)
+                    return {"success": True, "tool": "slack", "result": result}
+                else:
+                    return {"success": False, "tool": "slack", "error": f"Bot {self.config.name} not found"}
+            except Exception as e:
+                logger.error(f"Error updating Slack message: {e}")
+                return {"success": False, "tool": "slack", "error": str(e)}
+        return {"success": False, "tool": "slack", "error": "Slack not available"}
+    
     async def document(self, content: str, title: str, database_id: str = None) -> Dict:
         """Document information in Notion"""
         if "notion" in self.tools:
@@ -167,7 +668,7 @@ Communication style:
                     properties = {
                         "Title": {"title": [{"text": {"content": title}}]},
                         "Author": {"rich_text": [{"text": {"content": self.config.name}}]},
-                        "Date": {"date": {"start": datetime.now().isoformat()}}
+                        "Date": {"date": {"start": _now_iso()}}
                     }
                     
                     # Add content as a paragraph block
@@ -181,7 +682,7 @@ Communication style:
                         }
                     ]
                     
-                    result = notion.create_page(database_id, properties, children)
+                    result = await asyncio.to_thread(notion.create_page, database_id, properties, children)
                     return {"success": True, "tool": "notion", "result": result}
                 else:
                     return {"success": False, "tool": "notion", "error": "No database ID provided"}
@@ -195,7 +696,7 @@ Communication style:
         if "x_platform" in self.tools:
             try:
                 x_platform = self.tools["x_platform"]
-                result = x_platform.post_x_msg(message)
+                result = await asyncio.to_thread(x_platform.post_x_msg, message)
                 return {"success": True, "tool": "x_platform", "result": result}
             except Exception as e:
                 logger.error(f"Error posting to X: {e}")
@@ -205,8 +706,9 @@ Communication style:
 class StartupOrchestrator:
     """Main orchestrator for managing startup agents and tools"""
     
-    def __init__(self, startup_data: Dict):
+    def __init__(self, startup_data: Dict, env: EnvConfig = None):
         self.startup_data = startup_data
+        self.env = env or ENV_CONFIG
         self.agents: Dict[str, Agent] = {}
         self.tools: Dict[str, Any] = {}
         self.ai_client = None
@@ -217,7 +719,10 @@ class StartupOrchestrator:
         self.is_initialized = False
         self.is_sleeping = False
         self.sleep_task = None
-        self.working_session = None
+        self.working_session: Optional[Dict] = None
+        self._stop_event = None  # Set by stop_working_session to cut interval waits short
+        self._stop_loop = None
+        self._wake_event = None  # Set when a working session activates while agents sleep
         
         # Stateful integration management
         self.slack_channels = {}  # Cache created Slack channels
@@ -226,6 +731,8 @@ class StartupOrchestrator:
         
         # Centralized channel configuration - all discussions go to executive-meeting
         self.primary_discussion_channel = "executive-meeting"
+        self.x_limiter = AsyncTokenBucket(X_POSTS_PER_SEC)
+        self._status_cache = (0.0, None)  # (monotonic time, get_system_status snapshot)
         
         # Initialize AI client
         self._setup_ai_client()
@@ -242,8 +749,20 @@ class StartupOrchestrator:
         
         # Mark as initialized
         self.is_initialized = True
+        self._invalidate_status()
         logger.info("StartupOrchestrator initialized and ready")
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.aclose()
+        return False
+    
+    async def aclose(self):
+        """Release the loop-bound LLM connections before the caller's event loop closes"""
+        await self.ai_client.aclose()
+    
     def _setup_ai_client(self):
         """Setup AI client based on user preference"""
         api_keys = self.startup_data.get('api_keys', {})
@@ -252,8 +771,7 @@ class StartupOrchestrator:
         if 'OpenAI' in ai_provider:
             openai_key = api_keys.get('openai')
             if openai_key:
-                openai.api_key = openai_key
-                self.ai_client = openai
+                self.ai_client = OpenAIClient(openai_key)
             else:
                 raise ValueError("OpenAI API key not provided")
         else:
@@ -269,19 +787,16 @@ class StartupOrchestrator:
         selected_tools = self.startup_data.get('selected_tools', [])
         
         # Setup Slack
-        if "Slack" in selected_tools and SLACK_AVAILABLE:
+        SlackBotManager = _load_tool("tools.slack", "SlackBotManager", "Slack API") if "Slack" in selected_tools else None
+        if SlackBotManager:
             try:
                 # Create a Slack bot manager for multiple bots
                 slack_manager = SlackBotManager()
                 
                 # Add bots for all potential agents (we'll check if they exist later)
-                bot_names = ["CEO", "CFO", "CTO", "CMO"]
                 bots_added = 0
                 
-                for bot_name in bot_names:
-                    # Try to get token from environment with correct naming convention
-                    token_env_var = f"SLACK_API_TOKEN_{bot_name}"
-                    token = os.getenv(token_env_var)
+                for bot_name, token in self.env.slack_tokens.items():
                     if token:
                         try:
                             slack_manager.add_bot(bot_name, token)
@@ -290,7 +805,7 @@ class StartupOrchestrator:
                         except Exception as e:
                             logger.warning(f"Failed to add Slack bot {bot_name}: {e}")
                     else:
-                        logger.warning(f"Slack token not found for {bot_name} ({token_env_var})")
+                        logger.warning(f"Slack token not found for {bot_name} (SLACK_API_TOKEN_{bot_name})")
                 
                 if bots_added > 0:
                     self.tools["slack"] = slack_manager
@@ -304,11 +819,11 @@ class StartupOrchestrator:
             logger.warning("Slack selected but not available - skipping initialization")
         
         # Setup Notion
-        if "Notion" in selected_tools and NOTION_AVAILABLE:
+        NotionAPI = _load_tool("tools.notion", "NotionAPI", "Notion API") if "Notion" in selected_tools else None
+        if NotionAPI:
             try:
-                notion_token = os.getenv('NOTION_API_TOKEN')
-                if notion_token:
-                    self.tools["notion"] = NotionAPI(notion_token)
+                if self.env.notion_token:
+                    self.tools["notion"] = NotionAPI(self.env.notion_token)
                     logger.info("Notion integration initialized")
                 else:
                     logger.warning("Notion API token not found")
@@ -318,18 +833,13 @@ class StartupOrchestrator:
             logger.warning("Notion selected but not available - skipping initialization")
         
         # Setup X Platform
-        if "X Platform" in selected_tools and X_PLATFORM_AVAILABLE:
+        XPlatform = _load_tool("tools.x", "XPlatform", "X Platform API") if "X Platform" in selected_tools else None
+        if XPlatform:
             try:
                 # For now, using environment variables
                 # In real implementation, store in startup_data
-                x_config = {
-                    "api_key": os.getenv('X_API_KEY'),
-                    "api_secret": os.getenv('X_API_SECRET'),
-                    "access_token": os.getenv('X_ACCESS_TOKEN'),
-                    "access_token_secret": os.getenv('X_ACCESS_TOKEN_SECRET')
-                }
-                if all(x_config.values()):
-                    self.tools["x_platform"] = XPlatform(**x_config)
+                if self.env.x_credentials:
+                    self.tools["x_platform"] = XPlatform(**self.env.x_credentials)
                     logger.info("X Platform integration initialized")
                 else:
                     logger.warning("X Platform credentials not found")
@@ -380,6 +890,9 @@ class StartupOrchestrator:
         }
         
         for agent_name in selected_agents:
+            # Names arrive as fresh strings from session state; intern them so the
+            # agents/bots/discussions dicts all share one key object per agent
+            agent_name = sys.intern(agent_name)
             if agent_name in default_agents:
                 config_data = default_agents[agent_name]
             elif agent_name in custom_agents:
@@ -490,10 +1003,16 @@ class StartupOrchestrator:
                 if bot:
                     available_bots.append(bot)
             
-            # Invite each bot to the channel
-            for bot in available_bots:
+            if not available_bots:
+                return
+            
+            # Invite the bots in parallel; each join is an independent Slack round-trip
+            with ThreadPoolExecutor(max_workers=len(available_bots)) as pool:
+                joins = [(bot, pool.submit(bot.join_channel, channel_name)) for bot in available_bots]
+            
+            for bot, join in joins:
                 try:
-                    join_result = bot.join_channel(channel_name)
+                    join_result = join.result()
                     if join_result["success"]:
                         logger.info(f"✅ {bot.bot_name} joined #{channel_name}")
                     else:
@@ -511,9 +1030,9 @@ class StartupOrchestrator:
         
         try:
             # Use the NotionBackend to get the created databases
-            from notion_backend import NotionBackend
+            from notion_backend import get_notion_backend
             
-            notion_backend = NotionBackend()
+            notion_backend = get_notion_backend()
             
             # Get the database IDs from the backend
             if notion_backend.databases:
@@ -525,7 +1044,9 @@ class StartupOrchestrator:
             else:
                 logger.warning("⚠️ No Notion databases available - will be created on first use")
             
-            self.notion_initialized = True
+            # The resolved ID is kept for the orchestrator's lifetime; a missing one is
+            # looked up again on the next session start instead of being cached as absent
+            self.notion_initialized = self.notion_database_id is not None
                 
         except Exception as e:
             logger.error(f"Error setting up Notion database: {e}")
@@ -557,9 +1078,18 @@ Please provide your thoughts and recommendations based on your role.
         }
         
         # Start the discussion with the first agent
-        discussion_history = []
         agent_names = list(self.agents.keys())
         
+        # Each agent still responds to the previous one, so thinking stays sequential;
+        # Slack publishing runs in the background while the next agent thinks
+        publish_tasks = []
+        previous_publish = None
+        
+        # Shared by every turn so each prompt starts with the same bytes
+        discussion_prefix = f"""
+Discussion Topic: {agenda}
+"""
+        
         for i, agent_name in enumerate(agent_names):
             agent = self.agents[agent_name]
             
@@ -567,58 +1097,34 @@ Please provide your thoughts and recommendations based on your role.
                 # Build context based on previous responses
                 if i == 0:
                     # First agent starts the discussion
-                    discussion_context = f"""
-Discussion Topic: {agenda}
-
-You are {agent_name} ({agent.config.role}). Start the discussion on this topic.
-Keep your response under 100 words and conversational in tone.
-"""
+                    discussion_context = discussion_prefix + _OPEN_TURN_TEMPLATE % {
+                        "name": agent_name, "role": agent.config.role
+                    }
                 else:
                     # Subsequent agents respond to previous thoughts
                     previous_agent = agent_names[i-1]
                     previous_response = meeting_results["discussions"][previous_agent]
                     
-                    discussion_context = f"""
-Discussion Topic: {agenda}
-
-{previous_agent} just said: "{previous_response[:200]}..."
-
-You are {agent_name} ({agent.config.role}). Respond to {previous_agent}'s thoughts and add your perspective.
-Keep your response under 100 words and conversational in tone.
-"""
+                    discussion_context = discussion_prefix + _RESPOND_TURN_TEMPLATE % {
+                        "name": agent_name, "role": agent.config.role,
+                        "previous_agent": previous_agent, "previous_response": previous_response[:200]
+                    }
                 
                 # Agent thinks and responds
                 response = await agent.think(discussion_context)
                 
                 # Ensure response is concise (under 100 words)
-                words = response.split()
-                if len(words) > 100:
-                    response = ' '.join(words[:100]) + "..."
+                response = _limit_words(response)
                 
                 meeting_results["discussions"][agent_name] = response
-                discussion_history.append(f"{agent_name}: {response}")
                 
-                # Agent communicates in Slack
-                slack_result = await agent.communicate(
+                # Post to Slack without blocking the next agent
+                previous_publish = asyncio.create_task(self._publish_meeting_turn(
+                    agent,
                     response,
-                    self.primary_discussion_channel
-                )
-                
-                # Log Slack communication result
-                if slack_result["success"]:
-                    logger.info(f"✅ {agent_name} posted to Slack")
-                else:
-                    logger.warning(f"⚠️ {agent_name} failed to post to Slack: {slack_result.get('error', 'Unknown error')}")
-                    # Fallback: try to post to any available channel
-                    await self._fallback_slack_post(agent_name, response)
-                
-                # Document the discussion
-                if self.notion_database_id:
-                    doc_result = await agent.document(
-                        response,
-                        f"{agent_name} - Discussion on {agenda}",
-                        self.notion_database_id
-                    )
+                    previous_publish
+                ))
+                publish_tasks.append(previous_publish)
                 
                 logger.info(f"{agent_name} contributed to discussion")
                 
@@ -626,11 +1132,15 @@ Keep your response under 100 words and conversational in tone.
                 logger.error(f"Error with agent {agent_name}: {e}")
                 meeting_results["discussions"][agent_name] = f"Error: {str(e)}"
         
+        # Make sure every turn is published before the summary goes out
+        await asyncio.gather(*publish_tasks)
+        
         # Generate meeting summary
         summary_context = f"""
 Meeting Summary Request:
 Agenda: {agenda}
-Discussions: {json.dumps(meeting_results['discussions'], indent=2)}
+Discussions:
+{_format_contributions(meeting_results['discussions'])}
 
 Please provide a concise summary of the key decisions and action items from this meeting.
 """
@@ -642,14 +1152,6 @@ Please provide a concise summary of the key decisions and action items from this
                 summary = await ceo_agent.think(summary_context)
                 meeting_results["summary"] = summary
                 
-                # Document the meeting summary
-                if self.notion_database_id:
-                    await ceo_agent.document(
-                        summary,
-                        f"Meeting Summary - {agenda}",
-                        self.notion_database_id
-                    )
-                
                 # Post summary to Slack
                 await ceo_agent.communicate(
                     f"📋 **Meeting Summary**\n{summary}",
@@ -658,8 +1160,76 @@ Please provide a concise summary of the key decisions and action items from this
         except Exception as e:
             logger.error(f"Error generating meeting summary: {e}")
         
+        # Document every contribution and the summary in one Notion page
+        await self._batch_document_meeting(
+            f"Meeting Summary - {agenda}",
+            meeting_results["discussions"],
+            meeting_results.get("summary")
+        )
+        
         return meeting_results
     
+    async def _batch_document_meeting(self, title: str, contributions: Dict[str, str], summary: str = None) -> Dict:
+        """Document a whole discussion in a single Notion page, one section per agent plus the summary"""
+        if not self.notion_database_id or "notion" not in self.tools:
+            return {"success": False, "tool": "notion", "error": "Notion not available"}
+        
+        def heading(text):
+            return {"object": "block", "type": "heading_2", "heading_2": {"rich_text": [{"text": {"content": text}}]}}
+        
+        def paragraphs(text):
+            # Notion caps a single text object at 2000 characters
+            return [
+                {"object": "block", "type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": text[i:i + 2000]}}]}}
+                for i in range(0, len(text), 2000)
+            ]
+        
+        children = []
+        for agent_name, response in contributions.items():
+            children.append(heading(agent_name))
+            children.extend(paragraphs(response))
+        if summary:
+            children.append(heading("Summary"))
+            children.extend(paragraphs(summary))
+        
+        properties = {
+            "Title": {"title": [{"text": {"content": title}}]},
+            "Author": {"rich_text": [{"text": {"content": "CEO" if "CEO" in self.agents else "Executive Team"}}]},
+            "Date": {"date": {"start": _now_iso()}}
+        }
+        
+        try:
+            # Notion accepts up to 100 children when creating a page
+            result = await asyncio.to_thread(self.tools["notion"].create_page, self.notion_database_id, properties, children[:100])
+            return {"success": True, "tool": "notion", "result": result}
+        except Exception as e:
+            logger.error(f"Error documenting meeting in Notion: {e}")
+            return {"success": False, "tool": "notion", "error": str(e)}
+    
+    async def _publish_meeting_turn(self, agent: Agent, response: str, previous_publish: asyncio.Task = None):
+        """Post a meeting turn to Slack after the previous turn's post"""
+        agent_name = agent.config.name
+        try:
+            # Keep Slack messages in speaking order
+            if previous_publish:
+                await previous_publish
+            
+            # Agent communicates in Slack
+            slack_result = await agent.communicate(
+                response,
+                self.primary_discussion_channel
+            )
+            
+            # Log Slack communication result
+            if slack_result["success"]:
+                logger.info(f"✅ {agent_name} posted to Slack")
+            else:
+                logger.warning(f"⚠️ {agent_name} failed to post to Slack: {slack_result.get('error', 'Unknown error')}")
+                # Fallback: try to post to any available channel
+                await self._fallback_slack_post(agent_name, response)
+        except Exception as e:
+            logger.error(f"Error publishing {agent_name}'s turn: {e}")
+    
     async def execute_marketing_campaign(self, campaign_details: str) -> Dict:
         """Execute a marketing campaign using CMO agent"""
         if "CMO" not in self.agents:
@@ -683,12 +1253,12 @@ Please create a comprehensive marketing campaign plan including:
             
             campaign_plan = await cmo_agent.think(planning_context)
             
-            # Document the campaign plan
-            doc_result = await cmo_agent.document(
+            # Document the campaign plan while the posts are being written
+            doc_task = asyncio.create_task(cmo_agent.document(
                 campaign_plan,
                 f"Marketing Campaign Plan - {datetime.now().strftime('%Y-%m-%d')}",
                 self.notion_database_id
-            )
+            ))
             
             # Create social media posts
             social_context = f"""
@@ -703,19 +1273,24 @@ Make the posts engaging, professional, and aligned with the campaign goals.
             # Split into individual posts (simple approach)
             posts = [post.strip() for post in social_posts.split('\n\n') if post.strip()][:3]
             
-            # Post to X Platform
-            posted_results = []
-            for i, post in enumerate(posts):
-                if len(post) <= 280:  # X character limit
+            # Post to X Platform, paced by the token bucket to avoid rate limiting
+            async def publish_post(post_number: int, post: str) -> Dict:
+                async with self.x_limiter:
                     result = await cmo_agent.post_social(post)
-                    posted_results.append({
-                        "post_number": i + 1,
-                        "content": post,
-                        "result": result
-                    })
-                    
-                    # Wait between posts to avoid rate limiting
-                    await asyncio.sleep(2)
+                return {
+                    "post_number": post_number,
+                    "content": post,
+                    "result": result
+                }
+            
+            posted_results, doc_result = await asyncio.gather(
+                asyncio.gather(*(
+                    publish_post(i + 1, post)
+                    for i, post in enumerate(posts)
+                    if len(post) <= 280  # X character limit
+                )),
+                doc_task
+            )
             
             # Communicate campaign status
             await cmo_agent.communicate(
@@ -765,19 +1340,19 @@ Please generate a comprehensive financial report including:
             
             financial_report = await cfo_agent.think(context)
             
-            # Document the report
-            doc_result = await cfo_agent.document(
-                financial_report,
-                f"Financial Report - {datetime.now().strftime('%Y-%m-%d')}",
-                self.notion_database_id
-            )
-            
-            # Share with executive team
-            await cfo_agent.communicate(
-                f"💰 **Financial Report Generated**\n\n"
-                f"Report has been documented in Notion.\n"
-                f"Key highlights:\n{financial_report[:200]}...",
-                "executive-meetings"
+            # Document the report and share it with the executive team concurrently
+            doc_result, _ = await asyncio.gather(
+                cfo_agent.document(
+                    financial_report,
+                    f"Financial Report - {datetime.now().strftime('%Y-%m-%d')}",
+                    self.notion_database_id
+                ),
+                cfo_agent.communicate(
+                    f"💰 **Financial Report Generated**\n\n"
+                    f"Report has been documented in Notion.\n"
+                    f"Key highlights:\n{financial_report[:200]}...",
+                    "executive-meetings"
+                )
             )
             
             return {
@@ -790,9 +1365,18 @@ Please generate a comprehensive financial report including:
             logger.error(f"Error generating financial report: {e}")
             return {"success": False, "error": str(e)}
     
+    def _invalidate_status(self):
+        """Drop the cached status snapshot after a lifecycle or integration change"""
+        self._status_cache = (0.0, None)
+    
     def get_system_status(self) -> Dict:
-        """Get current system status"""
-        return {
+        """Get current system status; snapshots are reused for STATUS_CACHE_TTL_SECS"""
+        now = time.monotonic()
+        built_at, cached = self._status_cache
+        if cached is not None and now - built_at < STATUS_CACHE_TTL_SECS:
+            return cached
+        
+        status = {
             "agents": {
                 name: {
                     "role": agent.config.role,
@@ -806,11 +1390,13 @@ Please generate a comprehensive financial report including:
             "notion_databases": self.notion_databases,
             "business_info": self.startup_data.get('business_info', {}),
             "status": "active" if not self.is_sleeping else "sleeping",
-            "working_session": getattr(self, 'working_session', None),
+            "working_session": self.working_session,
             "agent_status": self.get_agent_status(),
             "integration_status": self.get_integration_status(),
             "slack_channels": self.slack_channels
         }
+        self._status_cache = (now, status)
+        return status
     
     async def start_working_session(self, start_datetime, end_datetime, duration_minutes: int) -> Dict:
         """Start a time-based working session for agents"""
@@ -820,25 +1406,31 @@ Please generate a comprehensive financial report including:
         if self.is_sleeping:
             self._wake_up_agents()
         
-        # Ensure integrations are ready (idempotent)
+        # Ensure integrations are ready (idempotent); Slack and Notion setup are
+        # independent blocking calls, so they run side by side in worker threads
+        setups = []
         if not self.slack_bots_initialized:
             logger.info("🔄 Ensuring Slack channels are ready...")
-            self._setup_slack_channels()
+            setups.append(asyncio.to_thread(self._setup_slack_channels))
         
         if not self.notion_initialized:
             logger.info("🔄 Ensuring Notion database is ready...")
-            self._setup_notion_database()
+            setups.append(asyncio.to_thread(self._setup_notion_database))
+        await asyncio.gather(*setups)
         
         self.working_session = {
             "is_active": True,
             "start_time": start_datetime,
             "end_time": end_datetime,
             "duration_minutes": duration_minutes,
-            "session_id": f"session_{int(time.time())}",
+            # Unique even for sessions started within the same second
+            "session_id": f"session_{time.monotonic_ns():x}_{uuid.uuid4().hex[:6]}",
             "activities": [],
             "decisions": [],
             "documentation": []
         }
+        self._invalidate_status()
+        self._signal_wake()
         
         # Start the working session
         try:
@@ -859,7 +1451,7 @@ Please provide your initial thoughts on what should be accomplished during this
             # Store the initial meeting
             self.working_session["activities"].append({
                 "type": "initial_meeting",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "result": meeting_result
             })
             
@@ -876,7 +1468,7 @@ Please provide your initial thoughts on what should be accomplished during this
     
     async def run_working_session(self) -> Dict:
         """Run the active working session with periodic agent interactions"""
-        if not hasattr(self, 'working_session') or not self.working_session.get('is_active'):
+        if not self.working_session or not self.working_session.get('is_active'):
             return {"success": False, "error": "No active working session"}
         
         session = self.working_session
@@ -892,6 +1484,20 @@ Please provide your initial thoughts on what should be accomplished during this
         
         activities = []
         
+        # Topics depend only on the business profile, so build them once
+        business_info = self.startup_data.get('business_info', {})
+        interaction_topics = (
+            f"Progress update and next steps for {business_info.get('name', 'our startup')}",
+            f"Strategic decisions needed for {business_info.get('industry', 'our industry')}",
+            f"Financial considerations for {business_info.get('business_model', 'our business model')}",
+            "Marketing opportunities and customer acquisition strategies",
+            "Technical roadmap and product development priorities"
+        )
+        
+        # Bound to this loop so stop_working_session can wake the interval wait
+        self._stop_event = asyncio.Event()
+        self._stop_loop = asyncio.get_running_loop()
+        
         try:
             # Run periodic agent interactions
             for i in range(interaction_count):
@@ -903,24 +1509,20 @@ Please provide your initial thoughts on what should be accomplished during this
                     break
                 
                 # Generate interaction topic based on business context
-                business_info = self.startup_data.get('business_info', {})
-                interaction_topics = [
-                    f"Progress update and next steps for {business_info.get('name', 'our startup')}",
-                    f"Strategic decisions needed for {business_info.get('industry', 'our industry')}",
-                    f"Financial considerations for {business_info.get('business_model', 'our business model')}",
-                    f"Marketing opportunities and customer acquisition strategies",
-                    f"Technical roadmap and product development priorities"
-                ]
-                
                 topic = interaction_topics[i % len(interaction_topics)]
                 
                 # Run agent interaction
                 interaction_result = await self._run_agent_interaction(topic, i + 1, interaction_count)
                 activities.append(interaction_result)
                 
-                # Wait for next interaction (if not the last one)
+                # Wait for next interaction (if not the last one), or until stopped
                 if i < interaction_count - 1:
-                    await asyncio.sleep(interval_minutes * 60)  # Convert to seconds
+                    try:
+                        await asyncio.wait_for(self._stop_event.wait(), timeout=interval_minutes * 60)
+                        logger.info("Working session stop requested")
+                        break
+                    except asyncio.TimeoutError:
+                        pass
             
             # Generate final session summary
             final_summary = await self._generate_session_summary(activities)
@@ -929,6 +1531,7 @@ Please provide your initial thoughts on what should be accomplished during this
             session["activities"].extend(activities)
             session["final_summary"] = final_summary
             session["is_active"] = False
+            self._invalidate_status()
             
             return {
                 "success": True,
@@ -949,7 +1552,7 @@ Please provide your initial thoughts on what should be accomplished during this
             "type": "agent_interaction",
             "interaction_number": interaction_number,
             "topic": topic,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "agent_contributions": {},
             "decisions": [],
             "action_items": []
@@ -958,94 +1561,102 @@ Please provide your initial thoughts on what should be accomplished during this
         # Start the discussion with the first agent
         agent_names = list(self.agents.keys())
         
-        for i, agent_name in enumerate(agent_names):
-            agent = self.agents[agent_name]
-            
-            try:
-                # Build context based on previous responses
-                if i == 0:
-                    # First agent starts the discussion
-                    discussion_context = f"""
+        # Shared by every turn so each prompt starts with the same bytes
+        discussion_prefix = f"""
 Working Session Interaction {interaction_number}/{total_interactions}
 Topic: {topic}
-
-You are {agent_name} ({agent.config.role}). Start the discussion on this topic.
-Keep your response under 100 words and conversational in tone.
-"""
-                else:
-                    # Subsequent agents respond to previous thoughts
-                    previous_agent = agent_names[i-1]
-                    previous_response = interaction["agent_contributions"][previous_agent]
-                    
-                    discussion_context = f"""
-Working Session Interaction {interaction_number}/{total_interactions}
-Topic: {topic}
-
-{previous_agent} just said: "{previous_response[:500]}..."
-
-You are {agent_name} ({agent.config.role}). Respond to {previous_agent}'s thoughts and add your perspective.
-Keep your response under 100 words and conversational in tone.
 """
-                
-                # Agent thinks and responds
-                response = await agent.think(discussion_context)
-                
-                # Ensure response is concise (under 100 words)
-                words = response.split()
-                if len(words) > 100:
-                    response = ' '.join(words[:100]) + "..."
-                
-                interaction["agent_contributions"][agent_name] = response
-                
-                # Agent communicates in Slack
-                await agent.communicate(
-                    response,
-                    self.primary_discussion_channel
-                )
-                
-                # Document in Notion
-                if self.notion_database_id:
-                    await agent.document(
-                        response,
-                        f"{agent_name} - {topic} (Interaction {interaction_number})",
-                        self.notion_database_id
-                    )
-                
+        
+        async def take_turn(agent_name: str, discussion_context: str) -> str:
+            # A stalled provider call only costs its own turn; the others still land
+            try:
+                response = await asyncio.wait_for(self.agents[agent_name].think(discussion_context), AGENT_TURN_TIMEOUT_SECS)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"no response within {AGENT_TURN_TIMEOUT_SECS}s") from None
+            # Ensure response is concise (under 100 words)
+            return _limit_words(response)
+        
+        def open_context(agent_name: str) -> str:
+            return discussion_prefix + _OPEN_TURN_TEMPLATE % {
+                "name": agent_name, "role": self.agents[agent_name].config.role
+            }
+        
+        def respond_context(agent_name: str, previous_agent: str, previous_preview: str) -> str:
+            return discussion_prefix + _RESPOND_TURN_TEMPLATE % {
+                "name": agent_name, "role": self.agents[agent_name].config.role,
+                "previous_agent": previous_agent, "previous_response": previous_preview
+            }
+        
+        # Two waves: the first agent opens the discussion, then everyone else
+        # responds to that opener concurrently instead of one after another
+        responses = []
+        if agent_names:
+            opener = agent_names[0]
+            try:
+                opener_response = await take_turn(opener, open_context(opener))
+                responses.append(opener_response)
             except Exception as e:
-                logger.error(f"Error with agent {agent_name}: {e}")
-                interaction["agent_contributions"][agent_name] = f"Error: {str(e)}"
+                responses.append(e)
+                opener_response = None
+            if opener_response is None:
+                # Without an opener there is nothing to respond to, so everyone opens on the topic
+                contexts = [open_context(agent_name) for agent_name in agent_names[1:]]
+            else:
+                # Every responder quotes the same preview, so slice it once
+                opener_preview = opener_response[:500]
+                contexts = [respond_context(agent_name, opener, opener_preview) for agent_name in agent_names[1:]]
+            responses.extend(await asyncio.gather(*(
+                take_turn(agent_name, context)
+                for agent_name, context in zip(agent_names[1:], contexts)
+            ), return_exceptions=True))
+        
+        publish_tasks = []
+        previous_publish = None
+        for agent_name, response in zip(agent_names, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error with agent {agent_name}: {response}")
+                interaction["agent_contributions"][agent_name] = f"Error: {str(response)}"
+                continue
+            
+            interaction["agent_contributions"][agent_name] = response
+            agent = self.agents[agent_name]
+            
+            # Slack posts stay in speaking order
+            previous_publish = asyncio.create_task(self._publish_meeting_turn(agent, response, previous_publish))
+            publish_tasks.append(previous_publish)
+        
+        await asyncio.gather(*publish_tasks, return_exceptions=True)
         
         # Generate interaction summary
         summary_context = f"""
 Interaction Summary Request:
 Topic: {topic}
-Agent Contributions: {json.dumps(interaction['agent_contributions'], indent=2)}
+Agent Contributions:
+{_format_contributions(interaction['agent_contributions'])}
 
 Please provide a concise summary of key decisions and action items from this interaction.
 """
         
+        ceo_agent = self.agents.get("CEO")
         try:
-            ceo_agent = self.agents.get("CEO")
             if ceo_agent:
-                summary = await ceo_agent.think(summary_context)
-                interaction["summary"] = summary
-                
-                # Document the interaction summary
-                if self.notion_database_id:
-                    await ceo_agent.document(
-                        summary,
-                        f"Interaction Summary - {topic}",
-                        self.notion_database_id
-                    )
-                
-                # Post summary to Slack
-                await ceo_agent.communicate(
-                    f"📋 **Interaction {interaction_number} Summary**\n{summary}",
-                    self.primary_discussion_channel
-                )
+                interaction["summary"] = await ceo_agent.think(summary_context)
         except Exception as e:
             logger.error(f"Error generating interaction summary: {e}")
         
+        # Document every contribution and the summary in one Notion page while the summary goes to Slack
+        publishes = [self._batch_document_meeting(
+            f"Interaction {interaction_number} - {topic}",
+            interaction["agent_contributions"],
+            interaction.get("summary")
+        )]
+        if interaction.get("summary"):
+            publishes.append(ceo_agent.communicate(
+                f"📋 **Interaction {interaction_number} Summary**\n{interaction['summary']}",
+                self.primary_discussion_channel
+            ))
+        await asyncio.gather(*publishes)
+        
         return interaction
     
     async def _generate_session_summary(self, activities: List[Dict]) -> Dict:
@@ -1080,39 +1691,66 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
         try:
             ceo_agent = self.agents.get("CEO")
             if ceo_agent:
-                final_summary = await ceo_agent.think(summary_context)
+                channel = self.primary_discussion_channel
+                header = "🎯 **Working Session Complete**\n\nSession Summary:\n"
                 
-                # Document the final summary
+                # Post to Slack as soon as the first tokens arrive, then edit the
+                # message in place as the rest streams in, one edit at a time
+                chunks = []
+                post = edit = None
+                async for delta in ceo_agent.think_stream(summary_context):
+                    chunks.append(delta)
+                    if post is None:
+                        post = asyncio.create_task(ceo_agent.communicate(header + delta, channel))
+                    elif post.done() and (edit is None or edit.done()):
+                        timestamp = _slack_timestamp(post.result())
+                        if timestamp:
+                            edit = asyncio.create_task(ceo_agent.communicate_update(header + "".join(chunks), timestamp, channel))
+                final_summary = "".join(chunks)
+                
+                # Finish the Slack post and document the summary concurrently
+                publishes = [self._finish_streamed_post(
+                    ceo_agent, post, edit,
+                    f"{header}{final_summary}\n\nAll documentation has been saved to Notion.",
+                    channel
+                )]
                 if self.notion_database_id:
-                    await ceo_agent.document(
+                    publishes.append(ceo_agent.document(
                         final_summary,
                         f"Working Session Summary - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
                         self.notion_database_id
-                    )
-                
-                # Post final summary to Slack
-                await ceo_agent.communicate(
-                    f"🎯 **Working Session Complete**\n\n"
-                    f"Session Summary:\n{final_summary}\n\n"
-                    f"All documentation has been saved to Notion.",
-                    self.primary_discussion_channel
-                )
+                    ))
+                await asyncio.gather(*publishes)
                 
                 return {
                     "summary": final_summary,
                     "activities_count": len(activities),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
         except Exception as e:
             logger.error(f"Error generating final summary: {e}")
             return {"error": str(e)}
     
+    async def _finish_streamed_post(self, agent: Agent, post, edit, message: str, channel: str) -> Dict:
+        """Replace a streamed Slack post with its final text, posting it outright if streaming never posted"""
+        if edit is not None:
+            await edit
+        timestamp = _slack_timestamp(await post) if post is not None else None
+        if timestamp:
+            return await agent.communicate_update(message, timestamp, channel)
+        return await agent.communicate(message, channel)
+    
     def stop_working_session(self) -> Dict:
         """Stop the active working session"""
-        if hasattr(self, 'working_session') and self.working_session.get('is_active'):
+        if self.working_session and self.working_session.get('is_active'):
             self.working_session['is_active'] = False
+            self._invalidate_status()
             logger.info("Working session stopped by user")
             
+            # Wake a running session out of its interval wait; may be called from another thread
+            if self._stop_event is not None and self._stop_loop is not None and not self._stop_loop.is_closed():
+                self._stop_loop.call_soon_threadsafe(self._stop_event.set)
+            
             # Start sleep cycle
             self._start_sleep_cycle()
             
@@ -1124,6 +1762,7 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
         """Start the sleep cycle for agents"""
         if not self.is_sleeping:
             self.is_sleeping = True
+            self._invalidate_status()
             logger.info("🤖 Agents entering sleep mode - no more reinitialization")
             
             # Cancel any existing sleep task
@@ -1131,6 +1770,7 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
                 self.sleep_task.cancel()
             
             # Start new sleep task
+            self._wake_event = asyncio.Event()
             self.sleep_task = asyncio.create_task(self._sleep_cycle())
     
     async def _sleep_cycle(self):
@@ -1138,12 +1778,13 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
         try:
             logger.info("💤 Agents are sleeping... Waiting for next working session")
             
-            # Sleep indefinitely until woken up
+            # Sleep until a working session signals the wake event
             while self.is_sleeping:
-                await asyncio.sleep(60)  # Check every minute
+                await self._wake_event.wait()
+                self._wake_event.clear()
                 
                 # If working session becomes active, wake up
-                if hasattr(self, 'working_session') and self.working_session.get('is_active'):
+                if self.working_session and self.working_session.get('is_active'):
                     self._wake_up_agents()
                     break
                     
@@ -1152,10 +1793,19 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
         except Exception as e:
             logger.error(f"Error in sleep cycle: {e}")
     
+    def _signal_wake(self):
+        """Wake a pending sleep cycle; safe to call from any thread"""
+        if self._wake_event is None or not self.sleep_task or self.sleep_task.done():
+            return
+        loop = self.sleep_task.get_loop()
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake_event.set)
+    
     def _wake_up_agents(self):
         """Wake up agents for working session"""
         if self.is_sleeping:
             self.is_sleeping = False
+            self._invalidate_status()
             logger.info("🌅 Agents waking up for working session!")
             
             # Cancel sleep task
@@ -1164,11 +1814,12 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
     
     def get_agent_status(self) -> Dict:
         """Get current agent status"""
+        session = self.working_session
         return {
             "is_initialized": self.is_initialized,
             "is_sleeping": self.is_sleeping,
-            "has_working_session": hasattr(self, 'working_session') and self.working_session is not None,
-            "working_session_active": hasattr(self, 'working_session') and self.working_session.get('is_active', False) if self.working_session else False,
+            "has_working_session": session is not None,
+            "working_session_active": bool(session and session.get('is_active')),
             "agents_count": len(self.agents),
             "tools_available": list(self.tools.keys()),
             "slack_channels_ready": len(self.slack_channels),
@@ -1188,12 +1839,15 @@ Business Context: {self.startup_data.get('business_info', {}).get('idea', 'Start
                 logger.warning(f"No bot found for {agent_name} in fallback posting")
                 return
             
-            # Try to post to primary discussion channel first, then any other available channel
+            # Retry the primary discussion channel first (often the only one), then any other
+            # available channel. Channels are tried one at a time: racing them would post the
+            # message more than once
             channels_to_try = [self.primary_discussion_channel] + [ch for ch in self.slack_channels.keys() if ch != self.primary_discussion_channel]
             
             for channel_name in channels_to_try:
                 try:
-                    result = agent_bot.send_slack_message(channel_name, agent_name, message)
+                    async with _slack_limiter(channel_name):
+                        result = await asyncio.to_thread(agent_bot.send_slack_message, channel_name, agent_name, message)
                     if result["success"]:
                         logger.info(f"✅ {agent_name} fallback posted to #{channel_name}")
                         return
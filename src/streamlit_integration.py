@@ -8,17 +8,75 @@ Connects the Streamlit UI to the agent orchestrator for autonomous startup manag
 import streamlit as st
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 import os # Added missing import for os
+import threading
+import hashlib
+import json
+import uuid
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 
 from orchestrator import StartupOrchestrator
-from notion_backend import NotionBackend
+from notion_backend import get_notion_backend
+
+# uvloop is a faster drop-in event loop where available (not on Windows)
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One event loop for the whole server, so sessions do not each leave a thread and loop behind
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+# Longest error text passed back to the UI or into logs; API errors can carry whole response bodies
+_ERROR_TEXT_LIMIT = 256
+
+def _err(error, limit: int = _ERROR_TEXT_LIMIT) -> str:
+    """Error text truncated to `limit` characters for display and result dicts"""
+    text = str(error)
+    return text if len(text) <= limit else text[:limit] + "…"
+
+# Startup data sections that must be filled in before launch, in reporting order
+_REQUIRED_FIELDS = ('selected_agents', 'selected_tools', 'api_keys', 'business_info')
+
+# AI provider label fragment -> api_keys entry that provider needs
+_PROVIDER_KEYS = (('OpenAI', 'openai'), ('Gemini', 'gemini'))
+
+# Streamlit >= 1.37 has st.fragment (experimental_fragment since 1.33); older versions rerun everything
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def _auto_refresh_fragment(seconds: float):
+    """Decorator making a function a fragment that reruns every `seconds`, when fragments are available"""
+    if _fragment is None:
+        return lambda func: func
+    return _fragment(run_every=seconds)
+
+# How often the working session monitor refreshes its status card
+SESSION_PANEL_REFRESH_SECS = 2
+
+# Record types listed by get_notion_data, in result order
+_NOTION_DATA_TYPES = ("Startup Config", "Working Session", "Agent Interaction", "System Update")
+
+def _log_queued_save(saved_message: str, failed_message: str):
+    """Done-callback reporting the outcome of a background Notion save"""
+    def log(future):
+        try:
+            save_result = future.result()
+        except Exception as e:
+            logger.error("Error saving to Notion backend: %s", e)
+            return
+        if save_result["success"]:
+            logger.info(saved_message)
+        else:
+            logger.warning("%s: %s", failed_message, _err(save_result.get('error', 'Unknown error')))
+    return log
+
 class StreamlitOrchestrator:
     """Streamlit wrapper for the StartupOrchestrator with Notion backend integration"""
     
@@ -26,6 +84,11 @@ class StreamlitOrchestrator:
         self.orchestrator = None
         self.notion_backend = None
         self.is_initialized = False
+        # Notion fields of the current working session that stay fixed from start to finish
+        self._session_payload = None
+        # Stable key for this wrapper in process-wide st.cache_data caches; id() values are
+        # reused after garbage collection, which could hand one session another's data
+        self.cache_key = uuid.uuid4().hex
     
     def initialize_from_session_state(self) -> bool:
         """Initialize orchestrator from Streamlit session state"""
@@ -34,15 +97,12 @@ class StreamlitOrchestrator:
                 st.error("❌ No startup data found. Please complete the configuration first.")
                 return False
             
-            startup_data = st.session_state.startup_data.copy()
-            
-            # Add custom agents to startup data
-            if 'custom_agents' in st.session_state:
-                startup_data['custom_agents'] = st.session_state.custom_agents
+            # Layer custom agents over the startup data without copying it; validation only reads
+            custom = {'custom_agents': st.session_state.custom_agents} if 'custom_agents' in st.session_state else {}
+            startup_data = ChainMap(custom, st.session_state.startup_data)
             
             # Validate required data
-            required_fields = ['selected_agents', 'selected_tools', 'api_keys', 'business_info']
-            missing_fields = [field for field in required_fields if not startup_data.get(field)]
+            missing_fields = [field for field in _REQUIRED_FIELDS if not startup_data.get(field)]
             
             if missing_fields:
                 st.error(f"❌ Missing required configuration: {', '.join(missing_fields)}")
@@ -52,64 +112,62 @@ class StreamlitOrchestrator:
             api_keys = startup_data['api_keys']
             ai_provider = api_keys.get('ai_provider', '')
             
-            if 'OpenAI' in ai_provider and not api_keys.get('openai'):
-                st.error("❌ OpenAI API key is required")
-                return False
-            elif 'Gemini' in ai_provider and not api_keys.get('gemini'):
-                st.error("❌ Gemini API key is required")
+            provider = next(((label, key) for label, key in _PROVIDER_KEYS if label in ai_provider), None)
+            if provider and not api_keys.get(provider[1]):
+                st.error(f"❌ {provider[0]} API key is required")
                 return False
             
             # Initialize Notion backend if Notion is selected
             if "Notion" in startup_data.get('selected_tools', []):
                 try:
-                    self.notion_backend = NotionBackend()
+                    self.notion_backend = get_notion_backend()
                     logger.info("Notion backend initialized")
                 except Exception as e:
-                    logger.warning(f"Failed to initialize Notion backend: {e}")
+                    logger.warning("Failed to initialize Notion backend: %s", e)
                     logger.info("Notion integration will be disabled - system will continue without Notion")
                     self.notion_backend = None
             
+            # Materialize once validation passes: the orchestrator and background save keep this snapshot
+            startup_data = dict(startup_data)
+            
             # Initialize orchestrator
             try:
                 self.orchestrator = StartupOrchestrator(startup_data)
                 self.is_initialized = True
                 logger.info("Orchestrator initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize orchestrator: {e}")
-                st.error(f"❌ Failed to initialize orchestrator: {str(e)}")
+                logger.error("Failed to initialize orchestrator: %s", e)
+                st.error(f"❌ Failed to initialize orchestrator: {_err(e)}")
                 return False
             
-            # Save startup config to Notion
+            # Save startup config to Notion in the background so launch isn't held up by the round-trip
             if self.notion_backend:
                 try:
-                    save_result = self.notion_backend.save_startup_config(startup_data)
-                    if save_result["success"]:
-                        logger.info("Startup configuration saved to Notion")
-                    else:
-                        logger.warning(f"Failed to save startup config to Notion: {save_result.get('error', 'Unknown error')}")
-                        st.error(f"❌ Failed to save startup config to Notion: {save_result.get('error', 'Unknown error')}")
+                    self.notion_backend.queue_startup_config(startup_data).add_done_callback(_log_queued_save(
+                        "Startup configuration saved to Notion", "Failed to save startup config to Notion"
+                    ))
                 except Exception as e:
-                    logger.error(f"Error saving to Notion backend: {e}")
+                    logger.error("Error saving to Notion backend: %s", e)
             else:
                 logger.info("Notion backend not available - skipping startup config save")
             
             # Save system update
             if self.notion_backend:
                 try:
-                    self.notion_backend.save_data(
+                    self.notion_backend.queue_data(
                         "System Launch",
                         f"LazyPreneur system launched with {len(startup_data.get('selected_agents', []))} agents and {len(startup_data.get('selected_tools', []))} tools",
                         "System Update"
                     )
                 except Exception as e:
-                    logger.error(f"Error saving system update to Notion: {e}")
+                    logger.error("Error saving system update to Notion: %s", e)
             
             # st.success("✅ LazyPreneur system initialized successfully!")
             return True
             
         except Exception as e:
-            st.error(f"❌ Failed to initialize system: {str(e)}")
-            logger.error(f"Initialization error: {e}")
+            st.error(f"❌ Failed to initialize system: {_err(e)}")
+            logger.error("Initialization error: %s", e)
             return False
     
     def get_system_status(self) -> Dict[str, Any]:
@@ -119,6 +177,15 @@ class StreamlitOrchestrator:
         
         return self.orchestrator.get_system_status()
     
+    def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """System, agent and working session status from a single status read"""
+        status = self.get_system_status()
+        return {
+            "system": status,
+            "agent": status.get("agent_status", {}),
+            "working_session": status.get("working_session")
+        }
+    
     async def run_startup_meeting_async(self, agenda: str) -> Dict[str, Any]:
         """Run a startup meeting asynchronously"""
         if not self.is_initialized or not self.orchestrator:
@@ -128,8 +195,8 @@ class StreamlitOrchestrator:
             result = await self.orchestrator.run_startup_meeting(agenda)
             return {"success": True, "result": result}
         except Exception as e:
-            logger.error(f"Meeting error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Meeting error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     async def execute_marketing_campaign_async(self, campaign_details: str) -> Dict[str, Any]:
         """Execute marketing campaign asynchronously"""
@@ -140,8 +207,8 @@ class StreamlitOrchestrator:
             result = await self.orchestrator.execute_marketing_campaign(campaign_details)
             return {"success": True, "result": result}
         except Exception as e:
-            logger.error(f"Campaign error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Campaign error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     async def generate_financial_report_async(self) -> Dict[str, Any]:
         """Generate financial report asynchronously"""
@@ -152,44 +219,49 @@ class StreamlitOrchestrator:
             result = await self.orchestrator.generate_financial_report()
             return {"success": True, "result": result}
         except Exception as e:
-            logger.error(f"Financial report error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Financial report error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     async def start_working_session_async(self, start_datetime, end_datetime, duration_minutes: int) -> Dict[str, Any]:
         """Start a working session asynchronously with Notion logging"""
         if not self.is_initialized or not self.orchestrator:
             return {"success": False, "error": "System not initialized"}
         
+        # Stringified up front; run_working_session_async reuses them for the final save
+        start_iso, end_iso = start_datetime.isoformat(), end_datetime.isoformat()
+        
         try:
             result = await self.orchestrator.start_working_session(start_datetime, end_datetime, duration_minutes)
+            if result["success"]:
+                self._session_payload = {
+                    "session_id": result["session_id"],
+                    "start_time": start_iso,
+                    "end_time": end_iso,
+                    "duration": duration_minutes
+                }
             
             # Save working session to Notion
             if result["success"] and self.notion_backend:
                 try:
                     session_data = {
-                        "session_id": result["result"]["session_id"],
-                        "start_time": start_datetime.isoformat(),
-                        "end_time": end_datetime.isoformat(),
-                        "duration": duration_minutes,
+                        **self._session_payload,
                         "is_active": True,
-                        "activities": result["result"].get("initial_meeting", {}).get("discussions", {}),
+                        "activities": result.get("initial_meeting", {}).get("discussions", {}),
                         "final_summary": None
                     }
-                    save_result = self.notion_backend.save_working_session(session_data)
-                    if save_result["success"]:
-                        logger.info("Working session saved to Notion")
-                    else:
-                        logger.warning(f"Failed to save working session to Notion: {save_result.get('error', 'Unknown error')}")
+                    self.notion_backend.queue_working_session(session_data).add_done_callback(_log_queued_save(
+                        "Working session saved to Notion", "Failed to save working session to Notion"
+                    ))
                 except Exception as e:
-                    logger.error(f"Error saving working session to Notion: {e}")
+                    logger.error("Error saving working session to Notion: %s", e)
             elif not self.notion_backend:
                 logger.info("Notion backend not available - skipping working session save")
             
             return {"success": True, "result": result}
             
         except Exception as e:
-            logger.error(f"Working session start error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Working session start error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     async def run_working_session_async(self) -> Dict[str, Any]:
         """Run working session asynchronously with Notion logging"""
@@ -204,37 +276,42 @@ class StreamlitOrchestrator:
                 try:
                     # Update the working session with final data
                     working_session = self.orchestrator.working_session
+                    payload = self._session_payload
+                    if payload is None or payload["session_id"] != working_session["session_id"]:
+                        # Session was started outside this wrapper
+                        payload = {
+                            "session_id": working_session["session_id"],
+                            "start_time": working_session["start_time"].isoformat(),
+                            "end_time": working_session["end_time"].isoformat(),
+                            "duration": working_session["duration_minutes"]
+                        }
                     session_data = {
-                        "session_id": working_session["session_id"],
-                        "start_time": working_session["start_time"].isoformat(),
-                        "end_time": working_session["end_time"].isoformat(),
-                        "duration": working_session["duration_minutes"],
+                        **payload,
                         "is_active": False,
                         "activities": working_session.get("activities", []),
                         "final_summary": result.get("final_summary", {}).get("summary", "")
                     }
                     
-                    save_result = self.notion_backend.save_working_session(session_data)
-                    if save_result["success"]:
-                        logger.info("Final working session data saved to Notion")
-                    else:
-                        logger.warning(f"Failed to save final session data to Notion: {save_result.get('error')}")
-                        
+                    # Both writes go to the backend's writer threads so the result returns without waiting on Notion
+                    self.notion_backend.queue_working_session(session_data).add_done_callback(_log_queued_save(
+                        "Final working session data saved to Notion", "Failed to save final session data to Notion"
+                    ))
+                    
                     # Save system update
-                    self.notion_backend.save_data(
+                    self.notion_backend.queue_data(
                         "Working Session Completed",
                         f"Session completed with {result.get('activities_count', 0)} activities",
                         "System Update"
                     )
                     
                 except Exception as e:
-                    logger.error(f"Error saving final session data to Notion: {e}")
+                    logger.error("Error saving final session data to Notion: %s", e)
             
             return {"success": True, "result": result}
             
         except Exception as e:
-            logger.error(f"Working session run error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Working session run error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     def stop_working_session(self) -> Dict[str, Any]:
         """Stop the active working session"""
@@ -245,27 +322,16 @@ class StreamlitOrchestrator:
             result = self.orchestrator.stop_working_session()
             return {"success": True, "result": result}
         except Exception as e:
-            logger.error(f"Working session stop error: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Working session stop error: %s", e)
+            return {"success": False, "error": _err(e)}
     
     def get_working_session_status(self) -> Dict[str, Any]:
         """Get current working session status"""
         if not self.is_initialized or not self.orchestrator:
             return {"status": "not_initialized"}
         
-        try:
-            status = self.orchestrator.get_system_status()
-            if not status:
-                return {"status": "error", "error": "Could not get system status"}
-            
-            working_session = status.get('working_session')
-            if working_session:
-                return working_session
-            else:
-                return {"status": "no_session"}
-        except Exception as e:
-            logger.error(f"Status error: {e}")
-            return {"status": "error", "error": str(e)}
+        # Read the session directly; building the full system status just to pick this out is wasted work
+        return self.orchestrator.working_session or {"status": "no_session"}
 
     def save_agent_interaction(self, agent_name: str, topic: str, response: str, tools_used: List[str], session_id: str) -> Dict[str, Any]:
         """Save agent interaction to Notion"""
@@ -275,15 +341,15 @@ class StreamlitOrchestrator:
         try:
             result = self.notion_backend.save_agent_interaction(agent_name, topic, response, session_id)
             if result["success"]:
-                logger.info(f"Agent interaction saved to Notion: {agent_name}")
+                logger.info("Agent interaction saved to Notion: %s", agent_name)
             else:
-                logger.warning(f"Failed to save agent interaction to Notion: {result.get('error')}")
+                logger.warning("Failed to save agent interaction to Notion: %s", _err(result.get('error')))
             
             return result
             
         except Exception as e:
-            logger.error(f"Error saving agent interaction to Notion: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Error saving agent interaction to Notion: %s", e)
+            return {"success": False, "error": _err(e)}
     
     def get_notion_data(self) -> Dict[str, Any]:
         """Get all data from Notion databases"""
@@ -291,74 +357,139 @@ class StreamlitOrchestrator:
             return {"success": False, "error": "Notion backend not available"}
         
         try:
+            # The four typed queries are independent round-trips, so issue them side by side
+            with ThreadPoolExecutor(max_workers=len(_NOTION_DATA_TYPES)) as pool:
+                configs, sessions, interactions, updates = pool.map(self.notion_backend.get_data, _NOTION_DATA_TYPES)
             data = {
-                "startup_configs": self.notion_backend.get_data("Startup Config"),
-                "working_sessions": self.notion_backend.get_data("Working Session"),
-                "agent_interactions": self.notion_backend.get_data("Agent Interaction"),
-                "system_updates": self.notion_backend.get_data("System Update"),
+                "startup_configs": configs,
+                "working_sessions": sessions,
+                "agent_interactions": interactions,
+                "system_updates": updates,
                 "success": True
             }
             return data
             
         except Exception as e:
-            logger.error(f"Error retrieving Notion data: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Error retrieving Notion data: %s", e)
+            return {"success": False, "error": _err(e)}
+
+def _config_hash() -> str:
+    """Digest of the launch configuration, independent of dict key order"""
+    config = {"startup_data": st.session_state.get('startup_data'), "custom_agents": st.session_state.get('custom_agents')}
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def get_orchestrator_wrapper() -> Optional[StreamlitOrchestrator]:
+    """Return this session's initialized StreamlitOrchestrator, rebuilding it only when the config changes"""
+    config_key = _config_hash()
+    cached = st.session_state.get('orchestrator_wrapper')
+    if cached and cached[0] == config_key and cached[1].is_initialized:
+        return cached[1]
+    
+    orchestrator_wrapper = StreamlitOrchestrator()
+    if not orchestrator_wrapper.initialize_from_session_state():
+        return None
+    st.session_state['orchestrator_wrapper'] = (config_key, orchestrator_wrapper)
+    return orchestrator_wrapper
+
+def _status_epoch() -> int:
+    """Counter folded into status cache keys; bumped whenever a session starts or stops"""
+    return st.session_state.get('status_epoch', 0)
+
+def _bump_status_epoch():
+    st.session_state['status_epoch'] = _status_epoch() + 1
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_notion_data(_orchestrator_wrapper: StreamlitOrchestrator, wrapper_key: str, epoch: int) -> Dict[str, Any]:
+    """Notion activity listing reused across reruns for a few seconds"""
+    return _orchestrator_wrapper.get_notion_data()
+
+def _interaction_pair(page: Dict[str, Any]) -> tuple:
+    """(agent name, topic) of an Agent Interaction page, with placeholders for missing properties"""
+    props = page.get('properties', {})
+    try:
+        agent_name = props['Agent Name']['select']['name']
+    except (KeyError, TypeError):
+        agent_name = 'Unknown'
+    try:
+        topic = props['Topic']['rich_text'][0]['text']['content']
+    except (KeyError, IndexError, TypeError):
+        topic = 'No topic'
+    return agent_name, topic
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_recent_interactions(_orchestrator_wrapper: StreamlitOrchestrator, wrapper_key: str, epoch: int, limit: int = 5):
+    """Latest agent interactions as (agent name, topic) pairs, or None when Notion data is unavailable"""
+    notion_data = _fetch_notion_data(_orchestrator_wrapper, wrapper_key, epoch)
+    if not notion_data or not notion_data.get("success"):
+        return None
+    return [_interaction_pair(page) for page in notion_data.get("agent_interactions", [])[-limit:]]
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """The process-wide long-lived event loop, running on a daemon thread so HTTP pools stay warm between reruns"""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            _bg_loop = _new_event_loop()
+            threading.Thread(target=_bg_loop.run_forever, name="orchestrator-loop", daemon=True).start()
+        return _bg_loop
+
+def run_coroutine(coro):
+    """Run a coroutine on the background loop and return its result (exceptions propagate)"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
 
 def run_async_function(async_func, *args, **kwargs):
     """Helper function to run async functions in Streamlit"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(async_func(*args, **kwargs))
-        loop.close()
-        return result
+        return run_coroutine(async_func(*args, **kwargs))
     except Exception as e:
-        logger.error(f"Async execution error: {e}")
-        return {"success": False, "error": str(e)}
+        logger.error("Async execution error: %s", e)
+        return {"success": False, "error": _err(e)}
+
+async def _start_and_run_working_session(orchestrator_wrapper: StreamlitOrchestrator, start_datetime, end_datetime, duration_minutes: int) -> Dict[str, Any]:
+    """Start a working session and run it to completion in one trip to the event loop"""
+    start_result = await orchestrator_wrapper.start_working_session_async(start_datetime, end_datetime, duration_minutes)
+    if not start_result["success"]:
+        return start_result
+    
+    # Start the background working session
+    run_result = await orchestrator_wrapper.run_working_session_async()
+    return {
+        "success": True,
+        "start_result": start_result["result"],
+        "run_result": run_result
+    }
 
 def start_working_session(start_datetime, end_datetime, duration_minutes: int):
     """Start a working session from Streamlit"""
     try:
-        # Initialize orchestrator
-        orchestrator_wrapper = StreamlitOrchestrator()
-        
-        if not orchestrator_wrapper.initialize_from_session_state():
+        orchestrator_wrapper = get_orchestrator_wrapper()
+        if not orchestrator_wrapper:
             return {"success": False, "error": "Failed to initialize orchestrator"}
         
-        # Start the working session
-        start_result = run_async_function(
-            orchestrator_wrapper.start_working_session_async,
-            start_datetime, end_datetime, duration_minutes
+        _bump_status_epoch()
+        return run_async_function(
+            _start_and_run_working_session,
+            orchestrator_wrapper, start_datetime, end_datetime, duration_minutes
         )
-        
-        if start_result["success"]:
-            # Start the background working session
-            run_result = run_async_function(
-                orchestrator_wrapper.run_working_session_async
-            )
-            
-            return {
-                "success": True,
-                "start_result": start_result["result"],
-                "run_result": run_result
-            }
-        else:
-            return start_result
             
     except Exception as e:
-        logger.error(f"Error starting working session: {e}")
-        return {"success": False, "error": str(e)}
+        logger.error("Error starting working session: %s", e)
+        return {"success": False, "error": _err(e)}
 
-def show_working_session_monitor():
-    """Show working session monitoring and status"""
-    st.subheader("⏰ Working Session Monitor")
-    
-    # Initialize orchestrator
-    orchestrator_wrapper = StreamlitOrchestrator()
-    
-    if not orchestrator_wrapper.initialize_from_session_state():
-        st.error("❌ System not initialized. Please complete configuration first.")
-        return
+def _stop_from_monitor(orchestrator_wrapper: StreamlitOrchestrator):
+    """Stop button callback - runs before the panel re-renders so it shows the stopped state"""
+    st.session_state['_monitor_stop_result'] = orchestrator_wrapper.stop_working_session()
+    _bump_status_epoch()
+
+@_auto_refresh_fragment(SESSION_PANEL_REFRESH_SECS)
+def _session_panel(orchestrator_wrapper: StreamlitOrchestrator):
+    """Working session status card; refreshes on its own without rerunning the page"""
+    stop_result = st.session_state.pop('_monitor_stop_result', None)
+    if stop_result is not None:
+        if stop_result["success"]:
+            st.success("✅ Working session stopped. Final documentation will be generated.")
+        else:
+            st.error(f"❌ Failed to stop session: {stop_result['error']}")
     
     # Get working session status
     session_status = orchestrator_wrapper.get_working_session_status()
@@ -399,13 +530,7 @@ def show_working_session_monitor():
                             st.write(f"**Summary:** {activity['summary']}")
         
         # Stop session button
-        if st.button("🛑 Stop Working Session", type="secondary"):
-            result = orchestrator_wrapper.stop_working_session()
-            if result["success"]:
-                st.success("✅ Working session stopped. Final documentation will be generated.")
-                st.rerun()
-            else:
-                st.error(f"❌ Failed to stop session: {result['error']}")
+        st.button("🛑 Stop Working Session", type="secondary", on_click=_stop_from_monitor, args=(orchestrator_wrapper,))
     
     else:
         st.info("⏸️ **No Active Working Session**")
@@ -416,25 +541,36 @@ def show_working_session_monitor():
             with st.expander("📋 Previous Session Summary"):
                 st.write(session_status['final_summary'])
 
+def show_working_session_monitor():
+    """Show working session monitoring and status"""
+    st.subheader("⏰ Working Session Monitor")
+    
+    orchestrator_wrapper = get_orchestrator_wrapper()
+    if not orchestrator_wrapper:
+        st.error("❌ System not initialized. Please complete configuration first.")
+        return
+    
+    _session_panel(orchestrator_wrapper)
+
 def launch_lazy_preneur():
     """Launch the LazyPreneur system from Streamlit"""
     
     try:
-        # Initialize orchestrator
-        orchestrator_wrapper = StreamlitOrchestrator()
-        
-        if not orchestrator_wrapper.initialize_from_session_state():
+        orchestrator_wrapper = get_orchestrator_wrapper()
+        if not orchestrator_wrapper:
             st.error("❌ Failed to initialize system. Please check your configuration.")
             return
         
         # Get system status with error handling
         try:
-            status = orchestrator_wrapper.get_system_status()
+            # The orchestrator already reuses its status snapshot for STATUS_CACHE_TTL_SECS
+            snapshot = orchestrator_wrapper.get_dashboard_snapshot()
+            status = snapshot["system"]
             if not status:
                 st.error("❌ Failed to get system status")
                 return
         except Exception as e:
-            st.error(f"❌ Error getting system status: {str(e)}")
+            st.error(f"❌ Error getting system status: {_err(e)}")
             return
         
         # Display system status
@@ -487,11 +623,12 @@ def launch_lazy_preneur():
         st.subheader("👥 Active Agents")
         agents = status.get('agents', {})
         if agents:
-            agent_cols = st.columns(3)
-            for i, (name, info) in enumerate(agents.items()):
-                with agent_cols[i % 3]:
-                    st.info(f"**{name}** ({info['role']})")
-                    st.write(f"Tools: {', '.join(info['tools'])}")
+            # One table element instead of two elements per agent
+            st.dataframe(
+                [{"Agent": name, "Role": info['role'], "Tools": ', '.join(info['tools'])} for name, info in agents.items()],
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.warning("⚠️ No agents initialized")
         
@@ -500,7 +637,7 @@ def launch_lazy_preneur():
         
         # Get agent status with error handling
         try:
-            agent_status = orchestrator_wrapper.orchestrator.get_agent_status()
+            agent_status = snapshot["agent"]
             
             # Display agent lifecycle status
             col1, col2 = st.columns(2)
@@ -522,7 +659,7 @@ def launch_lazy_preneur():
                     st.write("Set up a working session to start autonomous work")
                     
         except Exception as e:
-            st.warning(f"⚠️ Could not get agent status: {str(e)}")
+            st.warning(f"⚠️ Could not get agent status: {_err(e)}")
         
         st.info("""
         **🎯 LazyPreneur is designed to work autonomously!**
@@ -540,7 +677,7 @@ def launch_lazy_preneur():
         
         # Show current working session status if active
         try:
-            working_session = orchestrator_wrapper.get_working_session_status()
+            working_session = snapshot["working_session"] or {"status": "no_session"}
             if working_session and working_session.get('is_active'):
                 st.success(f"✅ **Active Working Session**")
                 st.write(f"**Session ID:** {working_session.get('session_id', 'Unknown')}")
@@ -550,16 +687,15 @@ def launch_lazy_preneur():
                 
                 # Show recent activities from Notion if available
                 try:
-                    notion_data = orchestrator_wrapper.get_notion_data()
-                    if notion_data and notion_data.get("success"):
-                        recent_activities = notion_data.get("agent_interactions", [])
+                    recent_activities = _fetch_recent_interactions(orchestrator_wrapper, orchestrator_wrapper.cache_key, _status_epoch())
+                    if recent_activities is not None:
                         if recent_activities:
                             st.subheader("📈 Recent Agent Activities")
-                            for activity in recent_activities[-5:]:  # Show last 5 activities
-                                props = activity.get('properties', {})
-                                agent_name = props.get('Agent Name', {}).get('select', {}).get('name', 'Unknown')
-                                topic = props.get('Topic', {}).get('rich_text', [{}])[0].get('text', {}).get('content', 'No topic')
-                                st.info(f"🤖 **{agent_name}**: {topic}")
+                            st.dataframe(  # Last 5 activities
+                                [{"Agent": agent_name, "Topic": topic} for agent_name, topic in recent_activities],
+                                use_container_width=True,
+                                hide_index=True
+                            )
                         else:
                             st.info("📝 No recent activities recorded yet. Agents will start working during the scheduled session.")
                     else:
@@ -570,13 +706,13 @@ def launch_lazy_preneur():
                 st.info("⏸️ **No active working session**")
                 st.write("Configure a working session in the 'Working Session Configuration' section above to start autonomous agent activities.")
         except Exception as e:
-            st.warning(f"⚠️ Could not get working session status: {str(e)}")
+            st.warning(f"⚠️ Could not get working session status: {_err(e)}")
             st.info("⏸️ **No active working session**")
             st.write("Configure a working session to start autonomous agent activities.")
             
     except Exception as e:
-        st.error(f"❌ Failed to launch system: {str(e)}")
+        st.error(f"❌ Failed to launch system: {_err(e)}")
         st.info("Please check your API keys and tool configurations.")
-        logger.error(f"Launch error: {e}")
+        logger.error("Launch error: %s", e)
 
  
\ No newline at end of file
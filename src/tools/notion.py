@@ -5,9 +5,175 @@ Lightweight Notion API Connection
 A simple class for interacting with Notion databases and pages.
 """
 
+import copy
+import json
 import os
-import requests
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from tools.session import REQUEST_TIMEOUT, new_pooled_session
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Optional faster JSON codec for request and response bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_bytes(payload) -> bytes:
+    """Serialize a request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def _json_loads(content: bytes):
+    """Parse a response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Optional typed decoder for query results: only the envelope fields the client
+# reads are decoded, and pages stay plain dicts for existing callers
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _QueryResponse(msgspec.Struct):
+        results: List[Dict[str, Any]] = msgspec.field(default_factory=list)
+        has_more: bool = False
+        next_cursor: Optional[str] = None
+    
+    _query_decoder = msgspec.json.Decoder(_QueryResponse)
+
+def _decode_query(content: bytes) -> Dict:
+    """Parse a database query response, using msgspec when it is installed"""
+    if msgspec is None:
+        return _json_loads(content)
+    response = _query_decoder.decode(content)
+    return {"results": response.results, "has_more": response.has_more, "next_cursor": response.next_cursor}
+
+# Notion allows an average of three requests per second per integration
+NOTION_MAX_CONCURRENCY = 3
+NOTION_REQUESTS_PER_SEC = 3
+
+# Most conditions Notion accepts in one compound ("or") filter
+NOTION_MAX_FILTER_CONDITIONS = 100
+
+def _page_title(properties: Dict) -> str:
+    """Plain text of a page's Title property, or "" when it has none"""
+    title_property = properties.get("Title")
+    if not isinstance(title_property, dict):
+        return ""
+    
+    # Handle different title property formats
+    runs = title_property.get("title") or title_property.get("rich_text")
+    if not runs:
+        return ""
+    text = runs[0].get("text")
+    return text.get("content", "") if isinstance(text, dict) else ""
+
+class _NotionRateLimiter:
+    """Caps in-flight Notion requests and paces them with a token bucket (thread-safe)"""
+    
+    def __init__(self, max_concurrency: int, per_second: int):
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._rate = per_second
+        self._capacity = per_second
+        self._tokens = float(per_second)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _wait_turn(self):
+        # Reserve a token under the lock (going negative when empty) and sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate) - 1
+            self._updated = now
+            delay = -self._tokens / self._rate
+        if delay > 0:
+            time.sleep(delay)
+    
+    @contextmanager
+    def slot(self):
+        with self._slots:
+            self._wait_turn()
+            yield
+
+# Shared by every NotionAPI instance: the backend, the orchestrator and its agents
+_rate_limiter = _NotionRateLimiter(NOTION_MAX_CONCURRENCY, NOTION_REQUESTS_PER_SEC)
+
+# Statuses retried by NotionAPI._send: a 429 was not processed, so any method may be
+# resent, but a 503 may follow a partial write, so only GETs retry it
+_RETRY_STATUSES = (429, 503)
+_WRITE_RETRY_STATUSES = (429,)
+SEND_MAX_RETRIES = 3
+
+# Process-wide HTTP/2 client shared by every NotionAPI instance, each sending its own
+# headers per request; False once httpx[http2] is found missing
+_http2 = None
+_http2_lock = threading.Lock()
+
+def _http2_client():
+    """The shared HTTP/2 httpx client when httpx[http2] is installed, otherwise None"""
+    global _http2
+    if _http2 is None:
+        with _http2_lock:
+            if _http2 is None:
+                try:
+                    import httpx
+                    _http2 = httpx.Client(
+                        http2=True,
+                        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    )
+                except ImportError:
+                    _http2 = False
+    return _http2 or None
+
+# Database metadata rarely changes; title lookups are invalidated on page creation
+DATABASE_CACHE_TTL_SECS = 60
+TITLE_CACHE_TTL_SECS = 30
+# GET bodies kept with their ETag / Last-Modified for conditional revalidation
+CONDITIONAL_CACHE_TTL_SECS = 300
+CACHE_MAXSIZE = 512
+
+_MISSING = object()
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, ttl: float, maxsize: int = CACHE_MAXSIZE):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard_where(self, predicate):
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
 
 class NotionAPI:
     """Lightweight Notion API client for database operations"""
@@ -25,11 +191,124 @@ class NotionAPI:
             raise ValueError("Notion API token is required. Set NOTION_API_TOKEN environment variable or pass api_token to constructor.")
         
         self.base_url = "https://api.notion.com/v1"
+        # Endpoint URLs built once; per-database ones only append the ID
+        self._databases_url = self.base_url + "/databases"
+        self._database_url = self.base_url + "/databases/"
+        self._search_url = self.base_url + "/search"
+        self._pages_url = self.base_url + "/pages"
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json"
         }
+        
+        # Pooled keep-alive connections shared with the other tool clients; the
+        # constant headers live on the session instead of being passed per call
+        self.session = new_pooled_session()
+        self.session.headers.update(self.headers)
+        # Optional process-wide HTTP/2 client that multiplexes concurrent calls over one connection
+        self._http2 = _http2_client()
+        
+        # database_id -> retrieve_database result, (database_id, title) -> page ID or None
+        self._database_cache = _TTLCache(DATABASE_CACHE_TTL_SECS)
+        self._title_cache = _TTLCache(TITLE_CACHE_TTL_SECS)
+        # URL -> (ETag, Last-Modified, parsed body) of the last GET that sent validators
+        self._conditional_cache = _TTLCache(CONDITIONAL_CACHE_TTL_SECS)
+    
+    def invalidate_database(self, database_id: str):
+        """Drop cached metadata and title lookups for a database"""
+        self._database_cache.discard_where(lambda key: key == database_id)
+        self._title_cache.discard_where(lambda key: key[0] == database_id)
+    
+    def _request(self, method: str, url: str, payload: Optional[Dict] = None, decode=_json_loads) -> Tuple[bool, Any]:
+        """
+        Send a request once the process-wide Notion rate limiter grants a slot
+        
+        Args:
+            method: HTTP method
+            url: Endpoint URL, e.g. self._pages_url
+            payload: Optional JSON body
+            decode: Parser for a successful response body
+            
+        Returns:
+            (True, parsed response body) on success, (False, error message) otherwise
+        """
+        data = _json_bytes(payload) if payload is not None else None
+        headers = None
+        
+        # Revalidate GETs against the previous response's validators; a 304 reuses its body
+        cached = self._conditional_cache.get(url) if method == "GET" else _MISSING
+        if cached is not _MISSING:
+            etag, last_modified, _ = cached
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        try:
+            # 429s are retried with backoff (honouring Retry-After) by _send, inside the slot
+            with _rate_limiter.slot():
+                response = self._send(method, url, headers, data)
+            if response.status_code == 304 and cached is not _MISSING:
+                return True, cached[2]
+            if response.status_code < 400:
+                result = decode(response.content)
+                if method == "GET":
+                    etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._conditional_cache.set(url, (etag, last_modified, result))
+                return True, result
+            try:
+                return False, _json_loads(response.content).get('message', f"HTTP {response.status_code}")
+            except ValueError:
+                return False, f"HTTP {response.status_code}"
+        except Exception as e:
+            return False, str(e)
+    
+    def _send(self, method: str, url: str, headers: Optional[Dict], data: Optional[bytes]):
+        """Issue one HTTP request over HTTP/2 when available, otherwise the pooled requests session"""
+        if self._http2 is None:
+            def send():
+                return self.session.request(method, url, headers=headers, data=data, timeout=REQUEST_TIMEOUT)
+            
+            # The shared adapter retries GETs' statuses and every method's failed connects
+            if method == "GET":
+                return send()
+            connect_errors = ()
+        else:
+            from httpx import ConnectError, ConnectTimeout
+            
+            headers = {**self.headers, **headers} if headers else self.headers
+            
+            def send():
+                return self._http2.request(method, url, headers=headers, content=data)
+            
+            # httpx retries neither statuses nor connects; a failed connect never sent the request
+            connect_errors = (ConnectError, ConnectTimeout)
+        
+        # Back off on retryable statuses, honouring Retry-After
+        retry_statuses = _RETRY_STATUSES if method == "GET" else _WRITE_RETRY_STATUSES
+        for attempt in range(SEND_MAX_RETRIES + 1):
+            try:
+                response = send()
+            except connect_errors:
+                if attempt == SEND_MAX_RETRIES:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            if response.status_code not in retry_statuses or attempt == SEND_MAX_RETRIES:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            time.sleep(float(retry_after) if retry_after and retry_after.isdigit() else 0.5 * 2 ** attempt)
+    
+    @staticmethod
+    def _failure(action: str, error_msg: str) -> Dict:
+        return {
+            "success": False,
+            "error": error_msg,
+            "message": f"Failed to {action}: {error_msg}"
+        }
     
     def create_database(self, parent_page_id: str, title: str, properties: Dict) -> Dict:
         """
@@ -43,92 +322,54 @@ class NotionAPI:
         Returns:
             Dict with database creation result
         """
-        try:
-            url = f"{self.base_url}/databases"
-            
-            payload = {
-                "parent": {"page_id": parent_page_id},
-                "title": [{"text": {"content": title}}],
-                "properties": properties
-            }
-            
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "message": f"Database '{title}' created successfully",
-                    "database_id": result["id"],
-                    "database_url": result["url"],
-                    "title": title
-                }
-            else:
-                error_result = response.json() if response.content else {}
-                error_msg = error_result.get('message', f"HTTP {response.status_code}")
-                
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "message": f"Failed to create database: {error_msg}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Exception occurred while creating database: {str(e)}"
-            }
+        ok, result = self._request("POST", self._databases_url, {
+            "parent": {"page_id": parent_page_id},
+            "title": [{"text": {"content": title}}],
+            "properties": properties
+        })
+        if not ok:
+            return self._failure("create database", result)
+        
+        return {
+            "success": True,
+            "message": f"Database '{title}' created successfully",
+            "database_id": result["id"],
+            "database_url": result["url"],
+            "title": title
+        }
     
-    def search_databases(self, query: str) -> Dict:
+    def search_databases(self, query: str, page_size: Optional[int] = None) -> Dict:
         """
         Search for databases by name
         
         Args:
             query: Search query for database name
+            page_size: Optional maximum number of results to return
             
         Returns:
             Dict with search results
         """
-        try:
-            url = f"{self.base_url}/search"
-            
-            payload = {
-                "query": query,
-                "filter": {
-                    "value": "database",
-                    "property": "object"
-                }
-            }
-            
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                result = response.json()
-                databases = result.get("results", [])
-                
-                return {
-                    "success": True,
-                    "message": f"Found {len(databases)} databases matching '{query}'",
-                    "databases": databases,
-                    "count": len(databases)
-                }
-            else:
-                error_result = response.json() if response.content else {}
-                error_msg = error_result.get('message', f"HTTP {response.status_code}")
-                
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "message": f"Failed to search databases: {error_msg}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Exception occurred while searching databases: {str(e)}"
+        payload = {
+            "query": query,
+            "filter": {
+                "value": "database",
+                "property": "object"
             }
+        }
+        if page_size:
+            payload["page_size"] = page_size
+        
+        ok, result = self._request("POST", self._search_url, payload)
+        if not ok:
+            return self._failure("search databases", result)
+        
+        databases = result.get("results", [])
+        return {
+            "success": True,
+            "message": f"Found {len(databases)} databases matching '{query}'",
+            "databases": databases,
+            "count": len(databases)
+        }
     
     def retrieve_database(self, database_id: str) -> Dict:
         """
@@ -140,41 +381,30 @@ class NotionAPI:
         Returns:
             Dict with database information
         """
-        try:
-            url = f"{self.base_url}/databases/{database_id}"
-            
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "message": f"Database '{result.get('title', [{}])[0].get('text', {}).get('content', 'Unknown')}' retrieved successfully",
-                    "database_id": result["id"],
-                    "database_url": result["url"],
-                    "title": result.get('title', [{}])[0].get('text', {}).get('content', 'Unknown'),
-                    "properties": result.get("properties", {}),
-                    "created_time": result.get("created_time"),
-                    "last_edited_time": result.get("last_edited_time")
-                }
-            else:
-                error_result = response.json() if response.content else {}
-                error_msg = error_result.get('message', f"HTTP {response.status_code}")
-                
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "message": f"Failed to retrieve database: {error_msg}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Exception occurred while retrieving database: {str(e)}"
-            }
+        cached = self._database_cache.get(database_id)
+        if cached is not _MISSING:
+            return copy.copy(cached)
+        
+        ok, result = self._request("GET", self._database_url + database_id)
+        if not ok:
+            return self._failure("retrieve database", result)
+        
+        title = result.get('title', [{}])[0].get('text', {}).get('content', 'Unknown')
+        database = {
+            "success": True,
+            "message": f"Database '{title}' retrieved successfully",
+            "database_id": result["id"],
+            "database_url": result["url"],
+            "title": title,
+            "properties": result.get("properties", {}),
+            "created_time": result.get("created_time"),
+            "last_edited_time": result.get("last_edited_time")
+        }
+        self._database_cache.set(database_id, database)
+        return copy.copy(database)
     
-    def query_database(self, database_id: str, filter_params: Optional[Dict] = None, sort_params: Optional[List] = None) -> Dict:
+    def query_database(self, database_id: str, filter_params: Optional[Dict] = None, sort_params: Optional[List] = None,
+                       start_cursor: Optional[str] = None, page_size: Optional[int] = None) -> Dict:
         """
         Query a database to retrieve pages/entries
         
@@ -182,49 +412,62 @@ class NotionAPI:
             database_id: ID of the database to query
             filter_params: Optional filter parameters
             sort_params: Optional sort parameters
+            start_cursor: Optional cursor from a previous result's next_cursor
+            page_size: Optional maximum number of pages to return (Notion caps it at 100)
             
         Returns:
             Dict with query results
         """
-        try:
-            url = f"{self.base_url}/databases/{database_id}/query"
-            
-            payload = {}
-            if filter_params:
-                payload["filter"] = filter_params
-            if sort_params:
-                payload["sorts"] = sort_params
+        payload = {}
+        if filter_params:
+            payload["filter"] = filter_params
+        if sort_params:
+            payload["sorts"] = sort_params
+        if start_cursor:
+            payload["start_cursor"] = start_cursor
+        if page_size:
+            payload["page_size"] = page_size
+        
+        ok, result = self._request("POST", self._database_url + database_id + "/query", payload, decode=_decode_query)
+        if not ok:
+            return self._failure("query database", result)
+        
+        pages = result.get("results", [])
+        return {
+            "success": True,
+            "message": f"Retrieved {len(pages)} pages from database",
+            "pages": pages,
+            "count": len(pages),
+            "has_more": result.get("has_more", False),
+            "next_cursor": result.get("next_cursor")
+        }
+    
+    def iter_database(self, database_id: str, filter_params: Optional[Dict] = None, sort_params: Optional[List] = None,
+                      page_size: int = 100) -> Iterator[Dict]:
+        """
+        Lazily iterate over every page matching a query, following next_cursor
+        
+        Args:
+            database_id: ID of the database to query
+            filter_params: Optional filter parameters
+            sort_params: Optional sort parameters
+            page_size: Pages fetched per request (Notion caps it at 100)
             
-            response = requests.post(url, headers=self.headers, json=payload)
+        Yields:
+            Page objects, one request's worth in memory at a time
             
-            if response.status_code == 200:
-                result = response.json()
-                pages = result.get("results", [])
-                
-                return {
-                    "success": True,
-                    "message": f"Retrieved {len(pages)} pages from database",
-                    "pages": pages,
-                    "count": len(pages),
-                    "has_more": result.get("has_more", False),
-                    "next_cursor": result.get("next_cursor")
-                }
-            else:
-                error_result = response.json() if response.content else {}
-                error_msg = error_result.get('message', f"HTTP {response.status_code}")
-                
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "message": f"Failed to query database: {error_msg}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Exception occurred while querying database: {str(e)}"
-            }
+        Raises:
+            RuntimeError: If a query fails
+        """
+        cursor = None
+        while True:
+            result = self.query_database(database_id, filter_params, sort_params, start_cursor=cursor, page_size=page_size)
+            if not result["success"]:
+                raise RuntimeError(result["message"])
+            yield from result["pages"]
+            if not result["has_more"] or not result["next_cursor"]:
+                return
+            cursor = result["next_cursor"]
     
     def _check_existing_page_by_title(self, database_id: str, title: str) -> Optional[str]:
         """
@@ -237,28 +480,25 @@ class NotionAPI:
         Returns:
             Page ID if found, None otherwise
         """
+        cached = self._title_cache.get((database_id, title))
+        if cached is not _MISSING:
+            return cached
+        
+        # Query the database for pages with the same title, stopping at the first match
+        pages = self.iter_database(database_id, filter_params={"property": "Title", "title": {"equals": title}}, page_size=1)
         try:
-            # Query the database for pages with the same title
-            filter_params = {
-                "property": "Title",
-                "title": {
-                    "equals": title
-                }
-            }
-            
-            result = self.query_database(database_id, filter_params=filter_params)
-            
-            if result["success"] and result["pages"]:
-                # Return the ID of the first matching page
-                return result["pages"][0]["id"]
-            
-            return None
-            
-        except Exception as e:
+            page = next(pages, None)
+        except RuntimeError:
             # If there's an error checking, assume no duplicate exists
             return None
+        
+        # Remember the ID of the first matching page, or that there is none
+        page_id = page["id"] if page else None
+        self._title_cache.set((database_id, title), page_id)
+        return page_id
     
-    def create_page(self, parent_id: str, properties: Dict, content: Optional[List] = None, is_database: bool = True) -> Dict:
+    def create_page(self, parent_id: str, properties: Dict, content: Optional[List] = None, is_database: bool = True,
+                    existing_titles: Optional[Dict[str, str]] = None) -> Dict:
         """
         Create a new page in a database or as a child of another page
         
@@ -267,80 +507,143 @@ class NotionAPI:
             properties: Page properties
             content: Optional page content blocks
             is_database: Whether the parent_id is a database ID (default: True)
+            existing_titles: Optional title -> page ID map already fetched for the database,
+                used instead of querying for a duplicate
             
         Returns:
             Dict with page creation result
         """
-        try:
-            # If creating in a database, check for existing page with same title
-            if is_database:
-                # Extract title from properties
-                title_property = properties.get("Title", {})
-                title_text = ""
-                
-                # Handle different title property formats
-                if isinstance(title_property, dict):
-                    if "title" in title_property and title_property["title"]:
-                        title_text = title_property["title"][0].get("text", {}).get("content", "")
-                    elif "rich_text" in title_property and title_property["rich_text"]:
-                        title_text = title_property["rich_text"][0].get("text", {}).get("content", "")
-                
-                # If we have a title, check for duplicates
-                if title_text:
-                    existing_page_id = self._check_existing_page_by_title(parent_id, title_text)
-                    if existing_page_id:
-                        return {
-                            "success": True,
-                            "message": f"Page with title '{title_text}' already exists",
-                            "page_id": existing_page_id,
-                            "already_exists": True,
-                            "page_url": f"https://notion.so/{existing_page_id.replace('-', '')}"
-                        }
+        # If creating in a database, check for existing page with same title
+        if is_database:
+            title_text = _page_title(properties)
             
-            url = f"{self.base_url}/pages"
-            
-            # Use the is_database parameter to determine parent type
-            if is_database:
-                payload = {
-                    "parent": {"database_id": parent_id},
-                    "properties": properties
-                }
-            else:
-                payload = {
-                    "parent": {"page_id": parent_id},
-                    "properties": properties
-                }
+            # If we have a title, check for duplicates
+            if title_text:
+                if existing_titles is not None:
+                    existing_page_id = existing_titles.get(title_text)
+                else:
+                    existing_page_id = self._check_existing_page_by_title(parent_id, title_text)
+                if existing_page_id:
+                    return {
+                        "success": True,
+                        "message": f"Page with title '{title_text}' already exists",
+                        "page_id": existing_page_id,
+                        "already_exists": True,
+                        "page_url": f"https://notion.so/{existing_page_id.replace('-', '')}"
+                    }
+        
+        # Use the is_database parameter to determine parent type
+        payload = {
+            "parent": {"database_id": parent_id} if is_database else {"page_id": parent_id},
+            "properties": properties
+        }
+        if content:
+            payload["children"] = content
+        
+        ok, result = self._request("POST", self._pages_url, payload)
+        if not ok:
+            return self._failure("create page", result)
+        
+        if is_database:
+            self.invalidate_database(parent_id)
+        return {
+            "success": True,
+            "message": "Page created successfully",
+            "page_id": result["id"],
+            "page_url": result["url"],
+            "created_time": result.get("created_time"),
+            "already_exists": False
+        }
+    
+    def _find_pages_by_titles(self, database_id: str, titles: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Look up many titles at once with "or" filters, following pagination
+        
+        Args:
+            database_id: ID of the database to search in
+            titles: Titles to search for
             
-            if content:
-                payload["children"] = content
+        Returns:
+            Dict of title -> page ID for the titles found, or None if a query failed
+        """
+        found = {}
+        for start in range(0, len(titles), NOTION_MAX_FILTER_CONDITIONS):
+            filter_params = {"or": [
+                {"property": "Title", "title": {"equals": title}}
+                for title in titles[start:start + NOTION_MAX_FILTER_CONDITIONS]
+            ]}
+            try:
+                for page in self.iter_database(database_id, filter_params=filter_params):
+                    found.setdefault(_page_title(page.get("properties", {})), page["id"])
+            except RuntimeError:
+                return None
+        return found
+    
+    def bulk_create_pages(self, database_id: str, pages: List[Dict]) -> List[Dict]:
+        """
+        Create several pages in a database with one batched duplicate check
+        
+        Args:
+            database_id: ID of the database
+            pages: Dicts with "properties" and optional "content" for each page
             
-            response = requests.post(url, headers=self.headers, json=payload)
+        Returns:
+            List of create_page results, in the order of pages
+        """
+        titles = list(dict.fromkeys(filter(None, (_page_title(page["properties"]) for page in pages))))
+        # If the batched lookup fails, each page falls back to its own duplicate check
+        existing_titles = self._find_pages_by_titles(database_id, titles) if titles else {}
+        
+        results = []
+        for page in pages:
+            result = self.create_page(database_id, page["properties"], page.get("content"), existing_titles=existing_titles)
+            # Later pages in the batch with the same title reuse this one
+            if existing_titles is not None and result["success"]:
+                title_text = _page_title(page["properties"])
+                if title_text:
+                    existing_titles.setdefault(title_text, result["page_id"])
+            results.append(result)
+        return results
+    
+    def create_pages_parallel(self, database_id: str, pages: List[Dict], max_workers: int = NOTION_MAX_CONCURRENCY) -> List[Dict]:
+        """
+        Create several pages in a database concurrently, with one batched duplicate check
+        
+        Args:
+            database_id: ID of the database
+            pages: Dicts with "properties" and optional "content" for each page
+            max_workers: Threads issuing requests; the shared rate limiter still caps throughput
             
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "message": "Page created successfully",
-                    "page_id": result["id"],
-                    "page_url": result["url"],
-                    "created_time": result.get("created_time"),
-                    "already_exists": False
-                }
-            else:
-                error_result = response.json() if response.content else {}
-                error_msg = error_result.get('message', f"HTTP {response.status_code}")
-                
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "message": f"Failed to create page: {error_msg}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Exception occurred while creating page: {str(e)}"
-            }
-
-
+        Returns:
+            List of create_page results, in the order of pages
+        """
+        titles = [_page_title(page["properties"]) for page in pages]
+        unique_titles = list(dict.fromkeys(filter(None, titles)))
+        # If the batched lookup fails, each page falls back to its own duplicate check
+        existing_titles = self._find_pages_by_titles(database_id, unique_titles) if unique_titles else {}
+        
+        # Only the first page per title is created concurrently, so repeats cannot race it
+        first, seen = [], set()
+        for index, title in enumerate(titles):
+            if not title or title not in seen:
+                first.append(index)
+                seen.add(title)
+        
+        def create(index: int) -> Dict:
+            page = pages[index]
+            return self.create_page(database_id, page["properties"], page.get("content"), existing_titles=existing_titles)
+        
+        results: List[Optional[Dict]] = [None] * len(pages)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notion-create") as executor:
+            for index, result in zip(first, executor.map(create, first)):
+                results[index] = result
+        
+        # Repeated titles reuse the page created (or found) for their first occurrence
+        if existing_titles is not None:
+            for index in first:
+                if titles[index] and results[index]["success"]:
+                    existing_titles.setdefault(titles[index], results[index]["page_id"])
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = create(index)
+        return results
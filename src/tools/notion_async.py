@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Async Notion Helpers
+
+Lets async callers issue many independent Notion writes concurrently on top of
+NotionAPI, which keeps its shared rate limiter, retries and caches.
+"""
+
+import asyncio
+from typing import Dict, List
+
+from tools.notion import NotionAPI
+
+async def gather_create_pages(notion: NotionAPI, parent_id: str, items: List[Dict], is_database: bool = True) -> List[Dict]:
+    """
+    Create several pages concurrently under the same parent without blocking the event loop
+
+    Args:
+        notion: Notion client to create the pages with
+        parent_id: ID of the parent (database or page)
+        items: Dicts with "properties" and optional "content" for each page
+        is_database: Whether the parent_id is a database ID (default: True)
+
+    Returns:
+        List of create_page results, in the order of items
+    """
+    if is_database:
+        # Checks every title in one query and creates each title only once, so repeats
+        # within the batch reuse the first page instead of racing it
+        return await asyncio.to_thread(notion.create_pages_parallel, parent_id, items)
+
+    # Pages under a page parent have no title check, so each is simply created
+    return await asyncio.gather(*(
+        asyncio.to_thread(notion.create_page, parent_id, item["properties"], item.get("content"), False)
+        for item in items
+    ))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Session
+
+Pooled HTTP connections reused by the Notion and Slack clients so
+keep-alive connections survive across calls and tools.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Optional
+
+# requests (and urllib3 beneath it) is imported on first use, so importing the
+# tool modules stays cheap for processes that never make an HTTP call
+if TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+# Connection pool sizing: one pool per host, shared by every client and thread
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# (connect, read) timeout in seconds for tool API calls, so a stalled peer cannot hang a worker
+REQUEST_TIMEOUT = (5, 30)
+
+_adapter: Optional["HTTPAdapter"] = None
+_adapter_lock = threading.Lock()
+
+def _retry():
+    from urllib3.util.retry import Retry
+    
+    # Failed connects are retried for every method, since nothing was sent. Status
+    # retries are limited to idempotent methods, so POSTs (e.g. Slack messages, Notion
+    # pages) are never duplicated; the clients retry their own 429s. Retry-After is honoured
+    return Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 503),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+def get_adapter() -> "HTTPAdapter":
+    """
+    Get the process-wide pooled transport adapter
+    
+    Sessions that mount it share its keep-alive connection pools, so a client
+    can keep its own default headers without opening separate connections.
+    Such sessions must not be closed, since that would close the shared pools.
+
+    Returns:
+        HTTPAdapter with connection pools and retry policy for all tool APIs
+    """
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                from requests.adapters import HTTPAdapter
+                
+                _adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=_retry())
+    return _adapter
+
+def new_pooled_session() -> "requests.Session":
+    """
+    Create a session whose requests use the shared connection pools
+
+    Returns:
+        requests.Session with the shared adapter mounted for http and https
+    """
+    import requests
+    
+    adapter = get_adapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,18 +1,129 @@
+import hashlib
+import json
+import logging
 import os
-import requests
+import random
+import threading
+from tools.session import REQUEST_TIMEOUT, new_pooled_session
 import time
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Optional faster JSON codec for request and response bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_bytes(payload) -> bytes:
+    """Serialize a request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def _json_loads(content: bytes):
+    """Parse a response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Calls that are rate limited (HTTP 429 or "ratelimited") are retried with jittered
+# exponential backoff, honouring Retry-After; GETs are also retried after a 5xx or
+# dropped connection, but POSTs are not, since Slack may already have acted on them
+SLACK_RATE_LIMIT_RETRIES = int(os.getenv("SLACK_RATE_LIMIT_RETRIES", "3"))
+RETRY_BASE_DELAY_SECS = 1.0
+RETRY_JITTER = 0.1
+
+# Slack's fair-use guidance is about one request per second per API method; each
+# bot token gets a bucket per method so e.g. posting does not starve channel listing
+SLACK_REQUESTS_PER_SEC = 1.0
+SLACK_BURST = 2
+
+# Message keys read_slack_message returns by default
+MESSAGE_FIELDS = ("ts", "user", "text")
+
+# Channel call errors that are retried once after joining the channel
+_JOIN_AND_RETRY_ERRORS = ("not_in_channel", "channel_not_found")
+
+# Errors that no retry can fix (bad name, scope or credentials); lookups and calls fail fast on these
+_UNRECOVERABLE = {"channel_not_found", "missing_scope", "not_authed", "invalid_auth", "account_inactive", "token_revoked"}
+
+# auth.test results shared by every Slack instance using the same token
+IDENTITY_TTL_SECS = 3600
+_identities: Dict[str, Tuple[Dict, float]] = {}
+
+# Channel name -> ID lookups are served from a cache filled by whole conversations.list scans
+CHANNEL_ID_TTL_SECS = 600
+CHANNEL_LIST_PAGE_SIZE = 1000
+
+# Process-wide HTTP/2 client for slack.com, so every bot's calls multiplex over one
+# TLS connection; False once httpx[http2] is found missing
+HTTP2_MAX_CONNECTIONS = 16
+_http2 = None
+_http2_lock = threading.Lock()
+
+def _http2_client():
+    """The shared HTTP/2 httpx client when httpx[http2] is installed, otherwise None"""
+    global _http2
+    if _http2 is None:
+        with _http2_lock:
+            if _http2 is None:
+                try:
+                    import httpx
+                    _http2 = httpx.Client(
+                        http2=True,
+                        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+                        limits=httpx.Limits(max_connections=HTTP2_MAX_CONNECTIONS, max_keepalive_connections=HTTP2_MAX_CONNECTIONS),
+                    )
+                except ImportError:
+                    _http2 = False
+    return _http2 or None
+
+class _TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep until it is due"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate) - 1
+            self._updated = now
+            delay = -self._tokens / self._rate
+        if delay > 0:
+            time.sleep(delay)
+
+# Shared by every Slack instance using the same token, keyed by (token, API method)
+_buckets: Dict[Tuple[str, str], _TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def _bucket(api_token: str, endpoint: str) -> _TokenBucket:
+    bucket = _buckets.get((api_token, endpoint))
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.setdefault((api_token, endpoint), _TokenBucket(SLACK_REQUESTS_PER_SEC, SLACK_BURST))
+    return bucket
 
 class Slack:
     """Simple Slack class for basic channel and message operations with multiple bot support"""
     
-    def __init__(self, bot_name: str, api_token: Optional[str] = None):
+    def __init__(self, bot_name: str, api_token: Optional[str] = None, session: Optional["requests.Session"] = None):
         """
         Initialize Slack client for a specific bot
         
         Args:
             bot_name: Name of the bot (used to get token from environment and identify the bot)
             api_token: Slack API token. If not provided, will try to get from environment using bot_name
+            session: Optional session shared with other bots; this bot's headers are then sent per request
         """
         if not bot_name:
             raise ValueError("bot_name is required to identify the bot")
@@ -36,6 +147,94 @@ class Slack:
         
         # Cache for bot identity
         self._bot_identity = None
+        
+        # channel name -> (channel ID, monotonic time cached)
+        self._channel_ids: Dict[str, Tuple[str, float]] = {}
+        self._channel_ids_lock = threading.Lock()
+        
+        # Pooled keep-alive connections shared with the other tool clients and bots. A
+        # session of our own carries this bot's token; a shared one gets it per request
+        if session is None:
+            self.session = new_pooled_session()
+            self.session.headers.update(self.headers)
+            self._request_headers = None
+        else:
+            self.session = session
+            self._request_headers = self.headers
+        # Preferred over the session when available; it always gets this bot's headers per request
+        self._http2 = _http2_client()
+    
+    def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """
+        Call a Slack Web API method, paced per bot and method, retrying rate limits and transient failures
+        
+        Only GETs are retried after a 5xx or dropped connection (POSTs only after a failed
+        connect), so a POST that Slack may have acted on is never resent. Other errors,
+        and any in _UNRECOVERABLE whatever the status, are returned at once.
+        
+        Args:
+            method: HTTP method
+            endpoint: Web API method name, e.g. "chat.postMessage"
+            **kwargs: Request body or query (json= or params=)
+            
+        Returns:
+            Parsed JSON response
+        """
+        idempotent = method == "GET"
+        if self._http2 is None:
+            # The shared adapter already retries failed connects for every method
+            from requests.exceptions import ConnectionError as SlackConnectionError
+            retryable_errors = SlackConnectionError if idempotent else ()
+        else:
+            # A failed connect never sent the body, so a POST is safe to resend after one
+            from httpx import ConnectError, ConnectTimeout, NetworkError
+            retryable_errors = (ConnectTimeout, NetworkError) if idempotent else (ConnectError, ConnectTimeout)
+        
+        url = f"{self.base_url}/{endpoint}"
+        # Encode the body once for every attempt; Content-Type is already on the session
+        if "json" in kwargs:
+            kwargs["data"] = _json_bytes(kwargs.pop("json"))
+        bucket = _bucket(self.api_token, endpoint)
+        for attempt in range(SLACK_RATE_LIMIT_RETRIES + 1):
+            last_attempt = attempt == SLACK_RATE_LIMIT_RETRIES
+            # Pace proactively so bursts wait here instead of drawing 429s
+            bucket.acquire()
+            try:
+                response = self._send(method, url, **kwargs)
+            except retryable_errors:
+                if last_attempt:
+                    raise
+                retry_after = 0
+            else:
+                transient = response.status_code == 429 or (idempotent and response.status_code >= 500)
+                if not transient:
+                    result = _json_loads(response.content)
+                    if result.get("error") != "ratelimited":
+                        return result
+                elif response.status_code >= 500:
+                    # An auth or scope error will not heal on retry, even behind a 5xx
+                    try:
+                        result = _json_loads(response.content)
+                    except ValueError:
+                        result = {}
+                    if result.get("error") in _UNRECOVERABLE:
+                        return result
+                if last_attempt:
+                    return _json_loads(response.content)
+                retry_after = response.headers.get("Retry-After", "")
+                retry_after = int(retry_after) if retry_after.isdigit() else 0
+            
+            delay = max(retry_after, RETRY_BASE_DELAY_SECS * 2 ** attempt)
+            time.sleep(delay * (1 + random.uniform(0, RETRY_JITTER)))
+    
+    def _send(self, method: str, url: str, **kwargs):
+        """Issue one HTTP request over the shared HTTP/2 client when available, otherwise the pooled requests session"""
+        if self._http2 is None:
+            return self.session.request(method, url, headers=self._request_headers, timeout=REQUEST_TIMEOUT, **kwargs)
+        # httpx takes a pre-encoded body as content=
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        return self._http2.request(method, url, headers=self.headers, **kwargs)
     
     def get_bot_identity(self) -> Dict:
         """
@@ -48,13 +247,15 @@ class Slack:
             return self._bot_identity
         
         try:
-            # Try to get bot info first
-            response = requests.get(
-                f"{self.base_url}/auth.test",
-                headers=self.headers
-            )
-            
-            result = response.json()
+            # Reuse another instance's auth.test for this token, keyed by a hash so tokens are not kept twice
+            token_key = hashlib.sha256(self.api_token.encode('utf-8')).hexdigest()
+            cached = _identities.get(token_key)
+            if cached and time.monotonic() - cached[1] < IDENTITY_TTL_SECS:
+                result = cached[0]
+            else:
+                result = self._request("GET", "auth.test")
+                if result.get('ok'):
+                    _identities[token_key] = (result, time.monotonic())
             
             if result.get('ok'):
                 self._bot_identity = {
@@ -96,7 +297,7 @@ class Slack:
         """
         try:
             # First check if channel already exists
-            existing_channel_id = self._get_channel_id(channel_name)
+            existing_channel_id, _ = self._get_channel_id(channel_name)
             if existing_channel_id:
                 return {
                     "success": True,
@@ -110,21 +311,18 @@ class Slack:
                 "is_private": False
             }
             
-            response = requests.post(
-                f"{self.base_url}/conversations.create",
-                headers=self.headers,
-                json=payload
-            )
-            
-            result = response.json()
+            result = self._request("POST", "conversations.create", json=payload)
             
             if result.get('ok'):
-                # Add a small delay to allow Slack to propagate the channel
-                time.sleep(2)
+                channel_id = result.get("channel", {}).get("id")
+                # Seed the cache instead of sleeping while conversations.list catches up;
+                # other bots' lookups still fall back to _get_channel_id_with_retry
+                if channel_id:
+                    self._cache_channel_ids({channel_name: channel_id})
                 return {
                     "success": True,
                     "message": f"Channel #{channel_name} created successfully by {self.bot_name}",
-                    "channel_id": result.get("channel", {}).get("id")
+                    "channel_id": channel_id
                 }
             else:
                 error_msg = result.get('error', 'Unknown error')
@@ -142,19 +340,20 @@ class Slack:
                 "message": f"Exception occurred while creating channel #{channel_name}"
             }
     
-    def join_channel(self, channel_name: str) -> Dict:
+    def join_channel(self, channel_name: str, bot_identity: Optional[Dict] = None) -> Dict:
         """
         Join a Slack channel
         
         Args:
             channel_name: Name of the channel to join
+            bot_identity: Result of get_bot_identity, if the caller already has it
             
         Returns:
             Dict with success status and response
         """
         try:
             # Get bot identity to know who's joining
-            bot_identity = self.get_bot_identity()
+            bot_identity = bot_identity or self.get_bot_identity()
             if not bot_identity["success"]:
                 return {
                     "success": False,
@@ -175,13 +374,7 @@ class Slack:
                 "channel": channel_id
             }
             
-            response = requests.post(
-                f"{self.base_url}/conversations.join",
-                headers=self.headers,
-                json=payload
-            )
-            
-            result = response.json()
+            result = self._request("POST", "conversations.join", json=payload)
             
             if result.get('ok'):
                 # Now we know exactly who's joining
@@ -216,6 +409,33 @@ class Slack:
                 "message": f"Exception occurred while joining channel #{channel_name}"
             }
     
+    def _in_channel(self, channel_name: str, channel_id: str, bot_identity: Dict, call) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Call a channel API method, joining the channel and retrying once if the bot is not a member
+        
+        Args:
+            channel_name: Name of the channel
+            channel_id: ID of the channel (usually from the cache)
+            bot_identity: Result of get_bot_identity
+            call: Function taking a channel ID and returning the parsed API response
+            
+        Returns:
+            (API response, None), or (None, failed join_channel result)
+        """
+        result = call(channel_id)
+        if result.get('error') not in _JOIN_AND_RETRY_ERRORS:
+            return result, None
+        
+        if result.get('error') == "channel_not_found":
+            # The cached ID may be stale, e.g. the channel was recreated under the same name
+            with self._channel_ids_lock:
+                self._channel_ids.pop(channel_name, None)
+        
+        join_result = self.join_channel(channel_name, bot_identity)
+        if not join_result["success"]:
+            return None, join_result
+        return call(join_result["channel_id"]), None
+    
     def send_slack_message(self, channel_name: str, bot_name: str, msg: str) -> Dict:
         """
         Send a message to a Slack channel (automatically joins if needed)
@@ -241,29 +461,21 @@ class Slack:
                     "message": f"Could not find channel #{channel_name}"
                 }
             
-            # Try to join the channel first (in case we're not in it)
-            join_result = self.join_channel(channel_name)
-            if not join_result["success"]:
+            # Call optimistically; the channel is only joined if we turn out not to be in it
+            result, join_result = self._in_channel(channel_name, channel_id, bot_identity, lambda channel_id: self._request(
+                "POST", "chat.postMessage", json={
+                    "channel": channel_id,
+                    "text": msg,
+                    "username": bot_name
+                }
+            ))
+            if join_result:
                 return {
                     "success": False,
                     "error": f"Could not join channel #{channel_name}",
                     "message": f"Failed to join channel before sending message: {join_result.get('error')}"
                 }
             
-            payload = {
-                "channel": channel_id,
-                "text": msg,
-                "username": bot_name
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/chat.postMessage",
-                headers=self.headers,
-                json=payload
-            )
-            
-            result = response.json()
-            
             if result.get('ok'):
                 return {
                     "success": True,
@@ -284,16 +496,70 @@ class Slack:
                 "error": str(e),
                 "message": f"Exception occurred while sending message to #{channel_name}"
             }
-    
-    def read_slack_message(self, channel_name: str) -> Dict:
+
+    def update_slack_message(self, channel_name: str, timestamp: str, msg: str) -> Dict:
+        """
+        Replace the text of a message previously sent to a Slack channel
+
+        Args:
+            channel_name: Name of the channel the message was sent to
+            timestamp: Timestamp returned by send_slack_message for the message
+            msg: New message content
+
+        Returns:
+            Dict with success status and response
+        """
+        try:
+            channel_id = self._get_channel_id_with_retry(channel_name)
+            if not channel_id:
+                return {
+                    "success": False,
+                    "error": f"Channel #{channel_name} not found",
+                    "message": f"Could not find channel #{channel_name}"
+                }
+
+            payload = {
+                "channel": channel_id,
+                "ts": timestamp,
+                "text": msg
+            }
+
+            result = self._request("POST", "chat.update", json=payload)
+
+            if result.get('ok'):
+                return {
+                    "success": True,
+                    "message": f"Message in #{channel_name} updated successfully",
+                    "timestamp": result.get("ts")
+                }
+            else:
+                error_msg = result.get('error', 'Unknown error')
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "message": f"Failed to update message in #{channel_name}: {error_msg}"
+                }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"Exception occurred while updating message in #{channel_name}"
+            }
+
+    def read_slack_message(self, channel_name: str, limit: int = 100, fields: Optional[Tuple[str, ...]] = MESSAGE_FIELDS,
+                           cursor: Optional[str] = None) -> Dict:
         """
         Read messages from a Slack channel (automatically joins if needed)
         
         Args:
             channel_name: Name of the channel to read messages from
+            limit: Maximum number of messages to return (newest first)
+            fields: Message keys to keep, or None for the full message objects
+            cursor: Optional next_cursor from a previous call, to read older messages
             
         Returns:
-            Dict with success status and messages
+            Dict with success status, messages and next_cursor (None on the last page)
         """
         try:
             # Get bot identity
@@ -308,35 +574,32 @@ class Slack:
                     "message": f"Could not find channel #{channel_name}"
                 }
             
-            # Try to join the channel first (in case we're not in it)
-            join_result = self.join_channel(channel_name)
-            if not join_result["success"]:
+            # Call optimistically; the channel is only joined if we turn out not to be in it
+            result, join_result = self._in_channel(channel_name, channel_id, bot_identity, lambda channel_id: self._request(
+                "GET", "conversations.history", params={
+                    "channel": channel_id,
+                    "limit": limit,
+                    **({"cursor": cursor} if cursor else {})
+                }
+            ))
+            if join_result:
                 return {
                     "success": False,
                     "error": f"Could not join channel #{channel_name}",
                     "message": f"Failed to join channel before reading messages: {join_result.get('error')}"
                 }
             
-            payload = {
-                "channel": channel_id,
-                "limit": 100  # Get last 100 messages
-            }
-            
-            response = requests.get(
-                f"{self.base_url}/conversations.history",
-                headers=self.headers,
-                params=payload
-            )
-            
-            result = response.json()
-            
             if result.get('ok'):
                 messages = result.get("messages", [])
+                # Keep only the requested keys so blocks, files and reactions are not passed on
+                if fields:
+                    messages = [{key: message.get(key) for key in fields} for message in messages]
                 return {
                     "success": True,
                     "message": f"Retrieved {len(messages)} messages from #{channel_name} using {bot_identity.get('user_name', self.bot_name)}",
                     "messages": messages,
-                    "count": len(messages)
+                    "count": len(messages),
+                    "next_cursor": result.get("response_metadata", {}).get("next_cursor") or None
                 }
             else:
                 error_msg = result.get('error', 'Unknown error')
@@ -353,21 +616,73 @@ class Slack:
                 "message": f"Exception occurred while reading messages from #{channel_name}"
             }
     
-    def list_all_channels(self) -> Dict:
+    def iter_messages(self, channel_name: str, fields: Optional[Tuple[str, ...]] = MESSAGE_FIELDS,
+                      page_size: int = 100) -> Iterator[Dict]:
+        """
+        Lazily iterate over a channel's history, newest first, following next_cursor
+        
+        Args:
+            channel_name: Name of the channel to read messages from
+            fields: Message keys to keep, or None for the full message objects
+            page_size: Messages fetched per request
+            
+        Yields:
+            Messages, one request's worth in memory at a time
+            
+        Raises:
+            RuntimeError: If a page cannot be read
+        """
+        cursor = None
+        while True:
+            result = self.read_slack_message(channel_name, limit=page_size, fields=fields, cursor=cursor)
+            if not result["success"]:
+                raise RuntimeError(result["message"])
+            yield from result["messages"]
+            cursor = result["next_cursor"]
+            if not cursor:
+                return
+    
+    def _scan_channels(self, exclude_archived: bool = False) -> Dict:
+        """
+        Fetch every channel, following cursors, and refresh the name -> ID cache
+        
+        Args:
+            exclude_archived: Whether to leave archived channels out of the listing
+            
+        Returns:
+            The last conversations.list response, with "channels" holding every page's channels
+        """
+        channels = []
+        params = {
+            "types": "public_channel,private_channel",
+            "exclude_archived": "true" if exclude_archived else "false",
+            "limit": CHANNEL_LIST_PAGE_SIZE
+        }
+        while True:
+            result = self._request("GET", "conversations.list", params=params)
+            if not result.get('ok'):
+                return result
+            channels.extend(result.get('channels', []))
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+        
+        self._cache_channel_ids({channel.get("name"): channel.get("id") for channel in channels})
+        return {**result, "channels": channels}
+    
+    def list_all_channels(self, exclude_archived: bool = False) -> Dict:
         """
         List all channels the bot can see
         
+        Args:
+            exclude_archived: Whether to leave archived channels out of the listing
+            
         Returns:
             Dict with success status and list of channels
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/conversations.list",
-                headers=self.headers,
-                params={"types": "public_channel,private_channel"}
-            )
-            
-            result = response.json()
+            result = self._scan_channels(exclude_archived)
             
             if result.get('ok'):
                 channels = result.get('channels', [])
@@ -406,24 +721,20 @@ class Slack:
         """
         try:
             # Get channel ID
-            channel_id = self._get_channel_id(channel_name)
+            channel_id, error_code = self._get_channel_id(channel_name)
             if not channel_id:
                 return {
                     "success": False,
-                    "error": f"Channel '{channel_name}' not found",
+                    "error": error_code or f"Channel '{channel_name}' not found",
                     "message": f"Cannot archive channel: {channel_name} not found"
                 }
             
             # Archive the channel
-            response = requests.post(
-                f"{self.base_url}/conversations.archive",
-                headers=self.headers,
-                json={"channel": channel_id}
-            )
-            
-            result = response.json()
+            result = self._request("POST", "conversations.archive", json={"channel": channel_id})
             
             if result.get('ok'):
+                with self._channel_ids_lock:
+                    self._channel_ids.pop(channel_name, None)
                 return {
                     "success": True,
                     "message": f"Successfully archived channel: {channel_name}",
@@ -444,7 +755,13 @@ class Slack:
                 "message": f"Exception occurred while archiving channel {channel_name}"
             }
     
-    def _get_channel_id(self, channel_name: str) -> Optional[str]:
+    def _cache_channel_ids(self, channel_ids: Dict[str, str]):
+        now = time.monotonic()
+        with self._channel_ids_lock:
+            for name, channel_id in channel_ids.items():
+                self._channel_ids[name] = (channel_id, now)
+    
+    def _get_channel_id(self, channel_name: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Get channel ID from channel name
         
@@ -452,27 +769,90 @@ class Slack:
             channel_name: Name of the channel
             
         Returns:
-            Channel ID or None if not found
+            (channel ID, None); (None, None) if the listing does not include it yet,
+            or (None, Slack error code) if the listing failed
         """
+        with self._channel_ids_lock:
+            cached = self._channel_ids.get(channel_name)
+        if cached and time.monotonic() - cached[1] < CHANNEL_ID_TTL_SECS:
+            return cached[0], None
+        
         try:
-            response = requests.get(
-                f"{self.base_url}/conversations.list",
-                headers=self.headers,
-                params={"types": "public_channel,private_channel"}
-            )
-            
-            result = response.json()
-            
-            if result.get('ok'):
-                channels = result.get('channels', [])
-                for channel in channels:
-                    if channel.get("name") == channel_name:
-                        return channel.get("id")
-            
-            return None
+            # One full scan caches every channel, so later lookups of any name are free
+            result = self._scan_channels()
+        except Exception as e:
+            result = {"ok": False, "error": str(e)}
+        
+        if result.get('ok'):
+            for channel in result.get('channels', []):
+                if channel.get("name") == channel_name:
+                    return channel.get("id"), None
+            # Listings lag channel creation, so absence is left retryable
+            return None, None
+        
+        # If Slack cannot be reached, an expired ID is better than none
+        if cached:
+            logger.warning("Could not list Slack channels (%s); using cached ID for #%s", result.get('error'), channel_name)
+            return cached[0], None
+        return None, result.get('error', 'Unknown error')
+    
+    def load_channel_cache(self, path: str) -> int:
+        """
+        Load channel IDs saved by save_channel_cache for this bot's workspace
+        
+        Expired entries are loaded too, as a fallback for when Slack cannot be reached.
+        
+        Args:
+            path: JSON file written by save_channel_cache
             
-        except Exception:
-            return None
+        Returns:
+            Number of loaded channel IDs that are still fresh
+        """
+        team_id = self.get_bot_identity().get("team_id")
+        if not team_id:
+            return 0
+        # Saved times are wall-clock; convert them to this process's monotonic clock
+        now_wall, now = time.time(), time.monotonic()
+        try:
+            with open(path, "rb") as f:
+                saved = _json_loads(f.read()).get(team_id, {})
+            ages = {name: (channel_id, now_wall - saved_at) for name, (channel_id, saved_at) in saved.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0
+        
+        with self._channel_ids_lock:
+            for name, (channel_id, age) in ages.items():
+                self._channel_ids.setdefault(name, (channel_id, now - age))
+        return sum(1 for _, age in ages.values() if age < CHANNEL_ID_TTL_SECS)
+    
+    def save_channel_cache(self, path: str):
+        """
+        Save this bot's channel IDs under its workspace, keeping other workspaces' entries
+        
+        Args:
+            path: JSON file to write
+        """
+        team_id = self.get_bot_identity().get("team_id")
+        if not team_id:
+            return
+        now_wall, now = time.time(), time.monotonic()
+        with self._channel_ids_lock:
+            entries = {name: [channel_id, now_wall - (now - cached_at)] for name, (channel_id, cached_at) in self._channel_ids.items()}
+        try:
+            with open(path, "rb") as f:
+                saved = _json_loads(f.read())
+        except (OSError, ValueError):
+            saved = {}
+        saved[team_id] = entries
+        
+        # Write to a temporary file and swap it in, so a crash never leaves a torn cache
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(_json_bytes(saved))
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.warning("Could not save Slack channel cache to %s: %s", path, e)
     
     def _get_channel_id_with_retry(self, channel_name: str, max_retries: int = 3) -> Optional[str]:
         """
@@ -485,10 +865,14 @@ class Slack:
         Returns:
             Channel ID or None if not found after retries
         """
+        # Cached IDs (including ones seeded by create_slack_channel) return on the first pass
         for attempt in range(max_retries):
-            channel_id = self._get_channel_id(channel_name)
+            channel_id, error_code = self._get_channel_id(channel_name)
             if channel_id:
                 return channel_id
+            if error_code in _UNRECOVERABLE:
+                logger.warning("Not retrying lookup of #%s: %s", channel_name, error_code)
+                break
             
             if attempt < max_retries - 1:
                 # Wait before retrying (exponential backoff)
@@ -502,6 +886,8 @@ class SlackBotManager:
     def __init__(self):
         """Initialize the bot manager"""
         self.bots = {}
+        # One session for every managed bot; each bot sends its own Authorization header
+        self.session = new_pooled_session()
     
     def add_bot(self, bot_name: str, api_token: Optional[str] = None) -> Slack:
         """
@@ -514,7 +900,7 @@ class SlackBotManager:
         Returns:
             Slack instance for the bot
         """
-        bot = Slack(bot_name, api_token)
+        bot = Slack(bot_name, api_token, session=self.session)
         self.bots[bot_name] = bot
         return bot
     
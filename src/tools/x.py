@@ -5,12 +5,41 @@ X Platform (Twitter) API Integration
 A lightweight placeholder for X Platform API integration.
 """
 
+import copy
 import os
 import logging
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Fixed placeholder responses, built once; every call returns a copy so callers may mutate it
+_PLACEHOLDER_MESSAGE = "X Platform integration is a placeholder"
+_POST_RESPONSE = {
+    "success": True,
+    "message": _PLACEHOLDER_MESSAGE,
+    "tweet_id": "placeholder_id",
+    "tweet_url": "https://x.com/placeholder"
+}
+_STATS_RESPONSE = {
+    "success": True,
+    "stats": {
+        "likes": 0,
+        "retweets": 0,
+        "replies": 0,
+        "views": 0
+    },
+    "message": _PLACEHOLDER_MESSAGE
+}
+_USER_RESPONSE = {
+    "success": True,
+    "user": {
+        "id": "placeholder_user_id",
+        "username": "placeholder_user",
+        "name": "Placeholder User"
+    },
+    "message": _PLACEHOLDER_MESSAGE
+}
+
 class XPlatform:
     """Placeholder X Platform API client"""
     
@@ -33,7 +62,7 @@ class XPlatform:
         self.access_token = access_token or os.getenv('X_ACCESS_TOKEN')
         self.access_token_secret = access_token_secret or os.getenv('X_ACCESS_TOKEN_SECRET')
         
-        if not all([self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
+        if not all((self.api_key, self.api_secret, self.access_token, self.access_token_secret)):
             logger.warning("X Platform credentials not fully configured")
         
         logger.info("X Platform client initialized (placeholder)")
@@ -48,14 +77,10 @@ class XPlatform:
         Returns:
             Dict with success status and response
         """
-        logger.info(f"X Platform placeholder: Would post message: {message[:50]}...")
-        return {
-            "success": True,
-            "message": "X Platform integration is a placeholder",
-            "text": message,
-            "tweet_id": "placeholder_id",
-            "tweet_url": "https://x.com/placeholder"
-        }
+        # Lazy %-formatting and the level check skip the slice when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("X Platform placeholder: Would post message: %s...", message[:50])
+        return dict(_POST_RESPONSE, text=message)
     
     def get_x_post_stats(self, tweet_id: str) -> Dict:
         """
@@ -67,17 +92,8 @@ class XPlatform:
         Returns:
             Dict with tweet statistics
         """
-        logger.info(f"X Platform placeholder: Would get stats for tweet {tweet_id}")
-        return {
-            "success": True,
-            "stats": {
-                "likes": 0,
-                "retweets": 0,
-                "replies": 0,
-                "views": 0
-            },
-            "message": "X Platform integration is a placeholder"
-        }
+        logger.info("X Platform placeholder: Would get stats for tweet %s", tweet_id)
+        return copy.deepcopy(_STATS_RESPONSE)
     
     def get_user_info(self) -> Dict:
         """
@@ -87,12 +103,4 @@ class XPlatform:
             Dict with user information
         """
         logger.info("X Platform placeholder: Would get user info")
-        return {
-            "success": True,
-            "user": {
-                "id": "placeholder_user_id",
-                "username": "placeholder_user",
-                "name": "Placeholder User"
-            },
-            "message": "X Platform integration is a placeholder"
-        } 
\ No newline at end of file
+        return copy.deepcopy(_USER_RESPONSE)
@@ -5,9 +5,15 @@ Slack Channel Cleanup Utility
 This script cleans up Slack channels created during LazyPreneur testing.
 """
 
+import atexit
 import os
+import re
 import sys
+import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict, Optional
 
 # Add the parent directory to the path so we can import our tools
@@ -15,8 +21,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.slack import Slack, SlackBotManager
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Channels that were likely created during testing
@@ -31,6 +35,60 @@ TEST_CHANNELS = [
     "demo-channel"
 ]
 
+# One compiled alternation, so each channel name is scanned once for every test name
+_TEST_CHANNEL_PATTERN = re.compile("|".join(map(re.escape, TEST_CHANNELS)))
+
+# Channel IDs persisted between runs, keyed by workspace
+CHANNEL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "lazypreneur", "slack_channels.json")
+
+# Seconds a channel listing is reused, so one CLI run (summary, then cleanup) lists channels once
+CHANNEL_LIST_TTL_SECS = 60
+
+# Archive concurrency adapts between these bounds; the Slack client's per-method buckets still pace the calls
+ARCHIVE_MIN_CONCURRENCY = 1
+ARCHIVE_MAX_CONCURRENCY = 8
+ARCHIVE_TARGET_LATENCY_SECS = 1.0
+
+# Slack error codes (after the client's own retries) that mean the API is overloaded, not that the archive was refused
+_OVERLOAD_ERRORS = ("ratelimited", "fatal_error", "internal_error", "service_unavailable", "request_timeout")
+
+class AIMDController:
+    """Thread-safe adaptive concurrency limit: additive increase while archives finish within
+    the latency target, multiplicative decrease when Slack reports overload"""
+    def __init__(self, initial: float = 2.0, minimum: float = ARCHIVE_MIN_CONCURRENCY, maximum: float = ARCHIVE_MAX_CONCURRENCY,
+                 target_latency: float = ARCHIVE_TARGET_LATENCY_SECS, alpha: float = 0.5, beta: float = 0.5):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.beta = beta
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def on_success(self, latency: float):
+        if latency <= self.target_latency:
+            with self._condition:
+                self.limit = min(self.maximum, self.limit + self.alpha)
+                # Wake waiting workers now that a slot may have opened
+                self._condition.notify_all()
+
+    def on_overload(self):
+        with self._condition:
+            self.limit = max(self.minimum, self.limit * self.beta)
+
+    @contextmanager
+    def slot(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
 class SlackCleanup:
     """Utility to clean up Slack channels created during testing"""
     
@@ -38,6 +96,9 @@ class SlackCleanup:
         """Initialize the cleanup utility"""
         self.slack_manager = SlackBotManager()
         self.ceo_bot = None
+        # Last successful listing and when it was taken (monotonic)
+        self._channels_cache: Optional[List[str]] = None
+        self._channels_cache_ts = 0.0
         self._setup_ceo_bot()
     
     def _setup_ceo_bot(self):
@@ -48,6 +109,10 @@ class SlackCleanup:
             try:
                 self.ceo_bot = self.slack_manager.add_bot("CEO", token)
                 logger.info("Added CEO bot for cleanup")
+                # Reuse channel IDs from earlier runs and save this run's on exit
+                loaded = self.ceo_bot.load_channel_cache(CHANNEL_CACHE_PATH)
+                logger.info(f"Loaded {loaded} cached channel IDs")
+                atexit.register(self.ceo_bot.save_channel_cache, CHANNEL_CACHE_PATH)
             except Exception as e:
                 logger.warning(f"Failed to add CEO bot: {e}")
         else:
@@ -59,13 +124,18 @@ class SlackCleanup:
             logger.error("CEO bot not available")
             return []
         
+        if self._channels_cache is not None and time.monotonic() - self._channels_cache_ts < CHANNEL_LIST_TTL_SECS:
+            return list(self._channels_cache)
+        
         try:
             result = self.ceo_bot.list_all_channels()
             if result["success"]:
                 channels = result.get("channels", [])
                 channel_names = [ch.get("name", "") for ch in channels]
                 logger.info(f"CEO bot can see {len(channel_names)} channels")
-                return channel_names
+                self._channels_cache = channel_names
+                self._channels_cache_ts = time.monotonic()
+                return list(channel_names)
             else:
                 logger.warning(f"Failed to list channels: {result.get('error')}")
                 return []
@@ -75,12 +145,7 @@ class SlackCleanup:
     
     def find_test_channels(self) -> List[str]:
         """Find test channels that need cleanup"""
-        all_channels = self.list_channels()
-        test_channels_found = []
-        
-        for channel in all_channels:
-            if any(test_channel in channel.lower() for test_channel in TEST_CHANNELS):
-                test_channels_found.append(channel)
+        test_channels_found = [channel for channel in self.list_channels() if _TEST_CHANNEL_PATTERN.search(channel.lower())]
         
         if test_channels_found:
             logger.info(f"Found test channels: {test_channels_found}")
@@ -89,9 +154,13 @@ class SlackCleanup:
     
     def archive_channel(self, channel_name: str) -> bool:
         """Archive a specific channel"""
+        return self._archive(channel_name) is None
+    
+    def _archive(self, channel_name: str) -> Optional[str]:
+        """Join and archive a channel; returns None on success, else the error"""
         if not self.ceo_bot:
             logger.error("CEO bot not available")
-            return False
+            return "CEO bot not available"
         
         try:
             # First, try to join the channel if we're not already in it
@@ -103,14 +172,26 @@ class SlackCleanup:
             archive_result = self.ceo_bot.archive_channel(channel_name)
             if archive_result["success"]:
                 logger.info(f"Successfully archived channel: {channel_name}")
-                return True
+                return None
             else:
                 logger.error(f"Failed to archive channel {channel_name}: {archive_result.get('error')}")
-                return False
+                return archive_result.get("error") or "unknown error"
             
         except Exception as e:
             logger.error(f"Error archiving channel {channel_name}: {e}")
-            return False
+            return str(e)
+    
+    def _archive_paced(self, limiter: AIMDController, channel_name: str) -> bool:
+        """Archive a channel within the adaptive concurrency limit, feeding back its outcome"""
+        with limiter.slot():
+            start = time.monotonic()
+            error = self._archive(channel_name)
+            latency = time.monotonic() - start
+        if error is None:
+            limiter.on_success(latency)
+        elif error in _OVERLOAD_ERRORS:
+            limiter.on_overload()
+        return error is None
     
     def cleanup_test_channels(self, dry_run: bool = True) -> List[str]:
         """Clean up test channels"""
@@ -125,18 +206,25 @@ class SlackCleanup:
         
         if dry_run:
             logger.info("DRY RUN MODE - No channels will actually be archived")
-        
-        for channel in test_channels:
-            if dry_run:
+            for channel in test_channels:
                 logger.info(f"[DRY RUN] Would archive channel: {channel}")
                 cleaned_channels.append(channel)
-            else:
-                if self.archive_channel(channel):
+            return cleaned_channels
+        
+        # Workers are capped at the upper bound; the controller decides how many archive at once
+        limiter = AIMDController()
+        with ThreadPoolExecutor(max_workers=ARCHIVE_MAX_CONCURRENCY, thread_name_prefix="slack-cleanup") as executor:
+            archived_flags = executor.map(lambda channel: self._archive_paced(limiter, channel), test_channels)
+            for channel, archived in zip(test_channels, archived_flags):
+                if archived:
                     cleaned_channels.append(channel)
                     logger.info(f"Successfully archived channel: {channel}")
                 else:
                     logger.error(f"Failed to archive channel: {channel}")
         
+        # Archived channels drop out of the listing, so the next one must come from Slack
+        self._channels_cache = None
+        
         return cleaned_channels
     
     def show_cleanup_summary(self):
@@ -219,4 +307,6 @@ def main():
         print("👋 Exiting without cleanup")
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, so importers keep their own setup
+    logging.basicConfig(level=logging.INFO)
     main()